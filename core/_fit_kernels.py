@@ -0,0 +1,153 @@
+"""Numeric kernels for the fitting-error evaluation.
+
+The nearest-sample search runs as a compiled parallel loop when Numba is
+available (see :mod:`core._numba_support`), otherwise vectorised in NumPy.
+Both return the exact nearest-sample distances (up to fastmath rounding in the
+compiled loop); ``tests/test_fit_kernels.py`` checks them against a brute-force scan.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from core import config
+from core._numba_support import jit, prange
+
+# Half-width of the sorted-x neighbourhood scanned for each nearest-sample lookup (NumPy path).
+_NN_WINDOW_HALF_WIDTH = 4
+
+
+def sample_dtype() -> type[np.floating]:
+    """Float type used for curve samples and distances in the fitting-error search.
+
+    float32 halves the memory traffic and is ample for status-level error
+    reporting; set ``DEBUG_FIT_FP64`` to compare against full precision.
+    """
+    return np.float64 if config.DEBUG_FIT_FP64 else np.float32
+
+
+def _nearest_sorted_samples_numpy(
+    xs: np.ndarray, ys: np.ndarray, qx: np.ndarray, qy: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Squared nearest-sample distances for query points against curve samples sorted by x.
+
+    A small window around each x-insertion point gives a candidate distance d; the
+    true nearest sample must lie within [qx - d, qx + d], so only queries whose
+    x-range reaches outside the window (steep or unevenly spaced regions near the
+    LE) are rescanned exactly.
+    """
+    k = _NN_WINDOW_HALF_WIDTH
+    idx = np.searchsorted(xs, qx)
+    window = np.clip(idx[:, None] + np.arange(-k, k + 1), 0, len(xs) - 1)
+    dx = xs[window] - qx[:, None]
+    dy = ys[window] - qy[:, None]
+    d2 = dx * dx + dy * dy
+    best = np.argmin(d2, axis=1)
+    rows = np.arange(len(qx))
+    min_d2 = d2[rows, best]
+    nn_idx = window[rows, best]
+
+    d = np.sqrt(min_d2)
+    lo = np.searchsorted(xs, qx - d, side="left")
+    hi = np.searchsorted(xs, qx + d, side="right")
+    # Compare positions, not widths: a narrow [lo, hi) can still extend past the window
+    window_lo = np.maximum(idx - k, 0)
+    window_hi = np.minimum(idx + k + 1, len(xs))
+    for i in np.nonzero((lo < window_lo) | (hi > window_hi))[0]:
+        seg_d2 = (xs[lo[i]:hi[i]] - qx[i]) ** 2 + (ys[lo[i]:hi[i]] - qy[i]) ** 2
+        j = int(np.argmin(seg_d2))
+        if seg_d2[j] < min_d2[i]:
+            min_d2[i] = seg_d2[j]
+            nn_idx[i] = lo[i] + j
+
+    return min_d2, nn_idx
+
+
+def _nearest_sorted_samples_loop(xs, ys, qx, qy, min_d2, nn_idx):
+    """Per-query binary search, then scan outwards until the x-gap alone exceeds the best distance."""
+    n = xs.shape[0]
+    m = qx.shape[0]
+    for i in prange(m):
+        px = qx[i]
+        py = qy[i]
+        lo = 0
+        hi = n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if xs[mid] < px:
+                lo = mid + 1
+            else:
+                hi = mid
+        best = np.inf
+        best_j = 0
+        j = lo
+        while j < n:
+            dx = xs[j] - px
+            if dx * dx >= best:
+                break
+            dy = ys[j] - py
+            d2 = dx * dx + dy * dy
+            if d2 < best:
+                best = d2
+                best_j = j
+            j += 1
+        j = lo - 1
+        while j >= 0:
+            dx = px - xs[j]
+            if dx * dx >= best:
+                break
+            dy = ys[j] - py
+            d2 = dx * dx + dy * dy
+            if d2 < best:
+                best = d2
+                best_j = j
+            j -= 1
+        min_d2[i] = best
+        nn_idx[i] = best_j
+
+
+def _nearest_sorted_samples_example() -> tuple:
+    dtype = sample_dtype()
+    xs = np.linspace(0.0, 1.0, 4, dtype=dtype)
+    zeros = np.zeros(4, dtype=dtype)
+    return xs, zeros, zeros, zeros, np.empty(4), np.empty(4, dtype=np.int64)
+
+
+_nearest_sorted_samples_jit = jit(
+    _nearest_sorted_samples_loop, _nearest_sorted_samples_example, parallel=True, fastmath=True
+)
+
+
+def nearest_sorted_samples(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    qx: np.ndarray,
+    qy: np.ndarray,
+    out_d2: np.ndarray | None = None,
+    out_idx: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Nearest-sample distances for query points against curve samples sorted by x.
+
+    Args:
+        xs: Sample x-coordinates, sorted ascending.
+        ys: Sample y-coordinates matching ``xs`` (same dtype).
+        qx: Query x-coordinates, converted to the dtype of ``xs``.
+        qy: Query y-coordinates matching ``qx``.
+        out_d2: Optional float64 buffer of length N receiving the squared distances.
+        out_idx: Optional int64 buffer of length N receiving the nearest-sample indices.
+
+    Returns:
+        Tuple ``(min_d2, nn_idx)`` of squared distances and indices into ``xs``.
+    """
+    qx = np.asarray(qx, dtype=xs.dtype)
+    qy = np.asarray(qy, dtype=xs.dtype)
+    m = len(qx)
+    min_d2 = np.empty(m, dtype=np.float64) if out_d2 is None else out_d2
+    nn_idx = np.empty(m, dtype=np.int64) if out_idx is None else out_idx
+    if _nearest_sorted_samples_jit is not None and len(xs) > 0:
+        _nearest_sorted_samples_jit(xs, ys, qx, qy, min_d2, nn_idx)
+    else:
+        min_d2[:], nn_idx[:] = _nearest_sorted_samples_numpy(xs, ys, qx, qy)
+    return min_d2, nn_idx
+
@@ -0,0 +1,46 @@
+"""Optional Numba support shared by the numeric kernel modules.
+
+Numba is not a hard dependency: :func:`jit` returns ``None`` when it is not
+installed and callers fall back to their vectorised NumPy implementation.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - numba is an optional speed-up
+    numba = None
+
+HAVE_NUMBA = numba is not None
+
+# Parallel range inside jitted loops; a plain range when the loop runs as Python.
+prange = numba.prange if HAVE_NUMBA else range
+
+_WARM_UP_CALLS: list[Callable[[], Any]] = []
+
+
+def jit(func: Callable, example_args: Callable[[], tuple], **options: Any) -> Callable | None:
+    """
+    Compile a loop function with Numba's ``njit`` (cached on disk) when available.
+
+    Args:
+        func: Loop implementation written in the Numba-compatible subset of Python.
+        example_args: Returns a tiny argument tuple with the dtypes used in practice;
+            :func:`warm_up` calls the compiled kernel with it.
+        **options: Extra ``njit`` options, e.g. ``parallel=True``.
+
+    Returns:
+        The compiled kernel, or ``None`` when Numba is not installed.
+    """
+    if not HAVE_NUMBA:
+        return None
+    compiled = numba.njit(cache=True, **options)(func)
+    _WARM_UP_CALLS.append(lambda: compiled(*example_args()))
+    return compiled
+
+
+def warm_up() -> None:
+    """Compile (or load from the on-disk cache) every kernel registered with :func:`jit`."""
+    for call in list(_WARM_UP_CALLS):
+        call()
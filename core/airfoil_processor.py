@@ -3,6 +3,7 @@ from PySide6.QtCore import QObject, Signal
 import logging
 
 from core import config
+from core._fit_kernels import sample_dtype
 from utils.data_loader import load_airfoil_data
 
 
@@ -17,6 +18,19 @@ class SignalLogHandler(logging.Handler):
         msg = self.format(record)
         self.signal_emitter.emit(msg)
 
+def _split_columns(data):
+    """Split an (N, 2) point array into contiguous x and y query columns, or (None, None).
+
+    The columns use the fitting-error sample dtype, so ``nearest_sorted_samples``
+    takes them as they are instead of converting on every call.
+    """
+    if data is None:
+        return None, None
+    data = np.asarray(data)
+    dtype = sample_dtype()
+    return np.ascontiguousarray(data[:, 0], dtype=dtype), np.ascontiguousarray(data[:, 1], dtype=dtype)
+
+
 class AirfoilProcessor(QObject):
     """
     Acts as a bridge between the GUI and the CoreProcessor.
@@ -29,7 +43,7 @@ class AirfoilProcessor(QObject):
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Core airfoil data
+        # Core airfoil data; assigning upper_data/lower_data also stores the fitting-error query columns
         self.upper_data = None
         self.lower_data = None
         self.upper_te_tangent_vector = None
@@ -39,6 +53,35 @@ class AirfoilProcessor(QObject):
         self._is_blunt_TE = False # True if original airfoil has thickened TE
 
 
+    @property
+    def upper_data(self):
+        """Upper surface points as an (N, 2) array, LE to TE."""
+        return self._upper_data
+
+    @upper_data.setter
+    def upper_data(self, value):
+        self._upper_data = value
+        self.upper_x, self.upper_y = _split_columns(value)
+
+    @property
+    def lower_data(self):
+        """Lower surface points as an (N, 2) array, LE to TE."""
+        return self._lower_data
+
+    @lower_data.setter
+    def lower_data(self, value):
+        self._lower_data = value
+        self.lower_x, self.lower_y = _split_columns(value)
+
+    def surface_columns(self, data):
+        """Return (x, y) query columns for ``data``, reusing the stored ones for the loaded surfaces."""
+        if data is not None:
+            if data is self._upper_data:
+                return self.upper_x, self.upper_y
+            if data is self._lower_data:
+                return self.lower_x, self.lower_y
+        return _split_columns(data)
+
     def load_airfoil_data_and_initialize_model(self, file_path):
         """
         Loads airfoil data and initializes the AirfoilModel.
@@ -169,7 +212,7 @@ class AirfoilProcessor(QObject):
             bspline_processor=bspline_processor,
             comb_bspline=comb_bspline,
         )
-        self._last_plot_data = plot_data.copy()
+        self._last_plot_data = plot_data
         self.plot_update_requested.emit(plot_data)
 
     def _calculate_te_tangent(self, upper_data, lower_data, te_vector_points):
@@ -5,6 +5,10 @@ from scipy import interpolate, optimize
 
 from core import config
 from utils import bspline_helper
+from utils.bounded_cache import BoundedCache
+
+# Surface parameterizations kept per processor (both surfaces, a couple of exponents).
+_U_PARAMS_CACHE_SIZE = 4
 
 class BSplineProcessor:
     """
@@ -49,6 +53,8 @@ class BSplineProcessor:
         self._backup_lower_control_points: np.ndarray | None = None
         self._backup_upper_knot_vector: np.ndarray | None = None
         self._backup_lower_knot_vector: np.ndarray | None = None
+        # Surface parameterizations: (id(data), exponent) -> (data, u_params)
+        self._u_params_cache = BoundedCache(_U_PARAMS_CACHE_SIZE)
 
 
     def fit_bspline(
@@ -150,6 +156,22 @@ class BSplineProcessor:
             self.fitted = False
             return False
 
+    def _surface_parameters(self, surface_data: np.ndarray, exponent: float) -> np.ndarray:
+        """Return the x-based parameterization of ``surface_data``, cached per data array.
+
+        The G2 path seeds itself with a G1 fit on the same arrays, so each surface
+        would otherwise be parameterized twice per fit.
+        """
+        key = (id(surface_data), float(exponent))
+        cached = self._u_params_cache.get(key, surface_data)
+        if cached is not None:
+            return cached
+
+        u_params = bspline_helper.create_parameter_from_x_coords(surface_data, exponent)
+        u_params.setflags(write=False)
+        self._u_params_cache.put(key, u_params, surface_data)
+        return u_params
+
     def _fit_with_g2_optimization(
         self,
         upper_data: np.ndarray,
@@ -169,8 +191,8 @@ class BSplineProcessor:
         te_point_lower = lower_data[-1]
         
         # Create parameter values
-        u_params_upper = bspline_helper.create_parameter_from_x_coords(upper_data, self.param_exponent_upper)
-        u_params_lower = bspline_helper.create_parameter_from_x_coords(lower_data, self.param_exponent_lower)
+        u_params_upper = self._surface_parameters(upper_data, self.param_exponent_upper)
+        u_params_lower = self._surface_parameters(lower_data, self.param_exponent_lower)
         
         # Create knot vectors (only if not using existing ones)
         if not use_existing_knot_vectors:
@@ -399,8 +421,8 @@ class BSplineProcessor:
         te_point_lower = lower_data[-1]
         
         # Create parameter values
-        u_params_upper = bspline_helper.create_parameter_from_x_coords(upper_data, self.param_exponent_upper)
-        u_params_lower = bspline_helper.create_parameter_from_x_coords(lower_data, self.param_exponent_lower)
+        u_params_upper = self._surface_parameters(upper_data, self.param_exponent_upper)
+        u_params_lower = self._surface_parameters(lower_data, self.param_exponent_lower)
         
         # Create knot vectors (only if not using existing ones)
         if not use_existing_knot_vectors:
@@ -6,6 +6,7 @@ Import these values instead of hard-coding magic numbers inside
 algorithms or UI widgets.
 """
 from __future__ import annotations
+import functools
 import json
 import os
 import sys
@@ -29,12 +30,14 @@ MIN_CP_NEIGHBOR_DISTANCE: float = 1.0e-3
 
 # ---- Sampling & Debugging -----------------------------------------------
 NUM_POINTS_CURVE_ERROR: int = 35000
+DEBUG_FIT_FP64: bool = False  # Compute fitting-error distances in float64 instead of float32
 
 # Plot sampling settings
 # Curvature-adaptive sampling improves visual smoothness near the leading edge
 # while keeping performance reasonable.
 PLOT_POINTS_PER_SURFACE: int = 500
 PLOT_CURVATURE_WEIGHT: float = 0.85  # 0 = uniform, 1 = fully curvature-driven
+PLOT_USE_OPENGL: bool = False  # Rasterize plot lines on the GPU (needs PyOpenGL and a working GL driver)
 
 # Curvature comb UI ranges
 # Old max density (100) becomes the new minimum. Allow much denser combs.
@@ -49,49 +52,43 @@ COMB_SCALE_DEFAULT: float = 0.020  # Reduced from 0.050 for better initial viewp
 DEFAULT_TE_VECTOR_POINTS: int = 2
 
 
+# Every annotated upper-case constant above is a user-overridable setting.
+_SETTING_NAMES: tuple[str, ...] = tuple(name for name in __annotations__ if name.isupper())
+
 USER_CONFIG_FILENAME = "airfoilfitter.config.json"
 LOADED_USER_CONFIG_PATH: str | None = None
+_IS_FROZEN: bool = bool(getattr(sys, "frozen", False))
 
 
-def _candidate_user_config_paths() -> list[Path]:
-    candidates: list[Path] = []
-
-    env_path = os.environ.get("AIRFOILFITTER_CONFIG", "").strip()
-    if env_path:
-        candidates.append(Path(env_path).expanduser())
-
-    if getattr(sys, "frozen", False):
-        candidates.append(Path(sys.executable).resolve().parent / USER_CONFIG_FILENAME)
-    else:
-        project_root = Path(__file__).resolve().parents[1]
-        candidates.append(project_root / USER_CONFIG_FILENAME)
-
-    return candidates
+# Override coercion keyed by the exact type of the default value. Exact type checks
+# keep JSON booleans out of int/float settings (bool is a subclass of int).
+_COERCERS = {
+    bool: lambda value: value if type(value) is bool else None,
+    int: lambda value: value if type(value) is int else None,
+    float: lambda value: float(value) if type(value) in (int, float) else None,
+}
 
 
 def _coerce_override_value(default_value: object, override_value: object) -> object | None:
-    if isinstance(default_value, bool):
-        return override_value if isinstance(override_value, bool) else None
+    coerce = _COERCERS.get(type(default_value))
+    return None if coerce is None else coerce(override_value)
 
-    if isinstance(default_value, int):
-        if isinstance(override_value, bool):
-            return None
-        return override_value if isinstance(override_value, int) else None
 
-    if isinstance(default_value, float):
-        if isinstance(override_value, bool):
-            return None
-        if isinstance(override_value, (int, float)):
-            return float(override_value)
-        return None
-
-    return None
+@functools.lru_cache(maxsize=1)
+def _load_user_overrides_once() -> None:
+    global LOADED_USER_CONFIG_PATH
 
+    candidates: list[Path] = []
+    env_path = os.environ.get("AIRFOILFITTER_CONFIG")
+    if env_path and env_path.strip():
+        candidates.append(Path(env_path.strip()).expanduser())
 
-def _apply_user_overrides() -> None:
-    global LOADED_USER_CONFIG_PATH
+    if _IS_FROZEN:
+        candidates.append(Path(sys.executable).resolve().parent / USER_CONFIG_FILENAME)
+    else:
+        candidates.append(Path(__file__).resolve().parents[1] / USER_CONFIG_FILENAME)
 
-    for cfg_path in _candidate_user_config_paths():
+    for cfg_path in candidates:
         if not cfg_path.is_file():
             continue
 
@@ -106,10 +103,11 @@ def _apply_user_overrides() -> None:
             print(f"[config] Ignoring '{cfg_path}': top-level JSON object expected.")
             return
 
+        overrides: dict[str, object] = {}
         for name, value in payload.items():
             if not isinstance(name, str) or not name.isupper():
                 continue
-            if name not in globals():
+            if name not in _SETTING_NAMES:
                 print(f"[config] Ignoring unknown key '{name}' in '{cfg_path}'.")
                 continue
 
@@ -122,10 +120,18 @@ def _apply_user_overrides() -> None:
                 )
                 continue
 
-            globals()[name] = new_value
+            overrides[name] = new_value
 
+        # Validate everything first, then publish to the module constants in one update
+        globals().update(overrides)
         LOADED_USER_CONFIG_PATH = str(cfg_path)
         return
 
 
-_apply_user_overrides()
+def ensure_loaded() -> None:
+    """Apply user JSON overrides to the module constants (only the first call does any I/O).
+
+    Call this from the application entry point before importing modules that bind
+    config values at import time (``from core.config import X`` or default arguments).
+    """
+    _load_user_overrides_once()
@@ -1,16 +1,62 @@
 from __future__ import annotations
 
-from typing import Any
+import functools
+from typing import TYPE_CHECKING, Any
 import numpy as np
-from scipy.interpolate import BSpline
-from scipy.spatial import cKDTree
+from PySide6.QtCore import QTimer
 from core import config
 from core.bspline_processor import BSplineProcessor
-from gui.workers.bspline_worker import BSplineWorker
+from core._fit_kernels import nearest_sorted_samples, sample_dtype
+from utils.bounded_cache import BoundedCache
+
+if TYPE_CHECKING:
+    from scipy.interpolate import BSpline
+    from gui.workers.bspline_worker import BSplineWorker
+
+# Quiet period after the last parameter change before a refit is started.
+_REFIT_DEBOUNCE_MS = 150
+# Pending plot refreshes are merged; the higher-priority kind wins.
+_PLOT_UPDATE_PRIORITY = {"data": 0, "bsplines": 1}
+# Number of sampled curves kept by the fitting-error sample cache.
+_CURVE_SAMPLE_CACHE_SIZE = 4
+# Number of error-sample design matrices kept (a few knot vectors per surface).
+_DESIGN_MATRIX_CACHE_SIZE = 4
+
+
+@functools.lru_cache(maxsize=4)
+def _error_sample_parameters(num_points: int) -> np.ndarray:
+    """Read-only parameter grid on [0, 1) used to densely sample curves for error evaluation."""
+    t_samples = np.linspace(0.0, 1.0, num_points)
+    if len(t_samples) > 0:
+        t_samples[-1] = min(t_samples[-1], 1.0 - 1e-12)
+    t_samples.setflags(write=False)
+    return t_samples
 
 
 class BSplineController:
     """Controller for B-spline operations, following existing architecture."""
+
+    __slots__ = (
+        "processor",
+        "window",
+        "bspline_processor",
+        "_current_worker",
+        "_refitting",
+        "_pending_fit_params",
+        "_curve_sample_cache",
+        "_reported_unsorted_samples",
+        "_last_comb_key",
+        "_last_comb_value",
+        "_buttons_enabled",
+        "_design_matrix_cache",
+        "_scratch",
+        "_refit_pending",
+        "_te_vectors_pending",
+        "_refit_timer",
+        "_pending_plot_kind",
+        # Qt keeps weak references to the receivers of bound-method slot connections
+        "__weakref__",
+    )
     
     def __init__(self, processor, window: Any):
         self.processor = processor
@@ -20,11 +66,69 @@ class BSplineController:
         # Store the B-spline processor in the window for access by other controllers
         self.window.bspline_processor = self.bspline_processor
         
-        # Worker thread for long-running operations
+        # Persistent worker for long-running operations, created on the first fit
         self._current_worker: BSplineWorker | None = None
+        # Set for re-fits that keep the current CP counts instead of resetting to the GUI value
+        self._refitting = False
+        # Parameters of the running fit, read by the completion handler
+        self._pending_fit_params: dict[str, Any] | None = None
+        # Sorted curve samples for error evaluation: (id(curve), n) -> (xs, ys, t_sorted)
+        self._curve_sample_cache = BoundedCache(_CURVE_SAMPLE_CACHE_SIZE)
+        self._reported_unsorted_samples = False
+        # Last state applied by _set_buttons_enabled: (enabled, file loaded, model built, G2 checked)
+        self._buttons_enabled: tuple[bool, bool, bool, bool] | None = None
+        # Sparse basis matrices at the error samples: (knots bytes, degree, n) -> CSR matrix
+        self._design_matrix_cache = BoundedCache(_DESIGN_MATRIX_CACHE_SIZE)
+        # Reusable per-query output buffers for the nearest-sample search, grown on demand
+        self._scratch: dict[str, np.ndarray] = {}
+        # Last curvature comb: (upper_curve, lower_curve, density, scale) -> comb data
+        self._last_comb_key: tuple[BSpline, BSpline, int, float] | None = None
+        self._last_comb_value: list | None = None
+
+        # Parameter changes arrive in bursts (spin box arrows, toggling G2 then G3);
+        # coalesce them so only the last requested refit actually runs.
+        self._refit_pending = False
+        self._te_vectors_pending = False
+        self._refit_timer = QTimer(self.window)
+        self._refit_timer.setSingleShot(True)
+        self._refit_timer.setInterval(_REFIT_DEBOUNCE_MS)
+        self._refit_timer.timeout.connect(self._on_refit_timer)
+
+        # Plot refresh requested during the current event-loop pass ("data" or "bsplines")
+        self._pending_plot_kind: str | None = None
 
     def refit_if_fitted(self) -> None:
-        """Re-fit B-spline if one is already fitted. Used for parameter changes.
+        """Schedule a re-fit if a B-spline is already fitted. Used for parameter changes.
+        
+        Rapid successive changes are debounced into a single re-fit.
+        """
+        self._refit_pending = True
+        self._refit_timer.start()
+
+    def handle_te_vector_points_changed(self) -> None:
+        """Schedule a TE vector update after the TE vector points dropdown changes.
+        
+        Rapid successive changes are debounced into a single update.
+        """
+        self._te_vectors_pending = True
+        self._refit_timer.start()
+
+    def _on_refit_timer(self) -> None:
+        """Run the pending TE vector update and/or re-fit once the changes have settled."""
+        if self._current_worker is not None and self._current_worker.isRunning():
+            # Try again once the running fit has finished instead of dropping the request
+            self._refit_timer.start()
+            return
+
+        te_pending, refit_pending = self._te_vectors_pending, self._refit_pending
+        self._te_vectors_pending = self._refit_pending = False
+
+        refit_started = te_pending and self._apply_te_vector_points_change()
+        if refit_pending and not refit_started:
+            self._do_refit()
+
+    def _do_refit(self) -> None:
+        """Re-fit B-spline if one is already fitted.
         
         Preserves the current control point configuration.
         """
@@ -39,21 +143,24 @@ class BSplineController:
         self._refitting = True
         self.fit_bspline()
 
-    def handle_te_vector_points_changed(self) -> None:
-        """Handle TE vector points dropdown changes.
+    def _apply_te_vector_points_change(self) -> bool:
+        """Apply the TE vector points dropdown value.
         
         Always recalculates TE vectors from the input data.
         If a fit exists and tangency is disabled: preserves the fit and just updates vectors.
         If a fit exists and tangency is enabled: re-fits with new TE vectors.
+
+        Returns:
+            True if a re-fit was started.
         """
         if getattr(self.processor, "upper_data", None) is None:
-            return  # No data loaded
+            return False  # No data loaded
         
         opt = self.window.optimizer_panel
         try:
             te_vector_points = int(opt.te_vector_points_combo.currentText())
         except ValueError:
-            return
+            return False
         
         is_fitted = self.bspline_processor.is_fitted()
         tangency_enabled = opt.enforce_te_tangency_checkbox.isChecked()
@@ -68,12 +175,13 @@ class BSplineController:
                 self.window.status_log.append("TE tangency enabled, re-fitting B-spline...")
                 self._refitting = True
                 self.fit_bspline()
-            else:
-                # Just update the plot with existing B-spline (preserves fit)
-                self._update_plot_with_bsplines()
+                return True
+            # Just update the plot with existing B-spline (preserves fit)
+            self._request_plot_update("bsplines")
         else:
             # No fit exists, just update the plot with TE vectors
-            self.processor.update_plot()
+            self._request_plot_update("data")
+        return False
 
 
 
@@ -85,8 +193,7 @@ class BSplineController:
 
         # Check if a worker is already running
         if self._current_worker is not None and self._current_worker.isRunning():
-            if hasattr(self, "_refitting"):
-                self._refitting = False
+            self._refitting = False
             self.window.status_log.append("A B-spline operation is already in progress. Please wait.")
             return
 
@@ -110,7 +217,7 @@ class BSplineController:
             
             # Determine control point counts
             # If we're coming from an automatic refinement (knot insertion), we might have asymmetric counts
-            if hasattr(self, "_refitting") and self._refitting:
+            if self._refitting:
                 num_cp_upper = self.bspline_processor.num_cp_upper
                 num_cp_lower = self.bspline_processor.num_cp_lower
                 self._refitting = False # Reset flag
@@ -132,9 +239,9 @@ class BSplineController:
                 'enforce_te_tangency': enforce_te_tangency,
             }
             
-            # Create and configure worker
-            self._current_worker = BSplineWorker(self.bspline_processor, self.window)
-            self._current_worker.setup_fit_operation(
+            # Configure the persistent worker
+            worker = self._get_worker()
+            worker.setup_fit_operation(
                 self.processor.upper_data,
                 self.processor.lower_data,
                 (num_cp_upper, num_cp_lower),
@@ -146,30 +253,36 @@ class BSplineController:
                 enforce_te_tangency,
             )
             
-            # Connect worker signals
-            self._current_worker.finished.connect(self._on_fit_finished)
-            self._current_worker.error.connect(self._on_worker_error)
-            self._current_worker.progress_message.connect(self._on_worker_progress)
-            
             # Start spinner and disable buttons
             self.window.status_log.start_spinner("Fitting B-spline")
             self._set_buttons_enabled(False)
             
-            # Start worker thread
-            self._current_worker.start()
+            # Queue the fit on the worker thread
+            worker.start()
 
         except Exception as e:  # pragma: no cover
             self.window.status_log.stop_spinner()
             self.window.status_log.append(f"Error during B-spline fitting setup: {e}")
             self._set_buttons_enabled(True)
     
+    def _get_worker(self) -> BSplineWorker:
+        """Return the long-lived worker, creating it and connecting its signals on first use."""
+        if self._current_worker is None:
+            from gui.workers.bspline_worker import BSplineWorker
+
+            self._current_worker = BSplineWorker(self.bspline_processor, self.window)
+            self._current_worker.finished.connect(self._on_fit_finished)
+            self._current_worker.error.connect(self._on_worker_error)
+            self._current_worker.progress_message.connect(self._on_worker_progress)
+        return self._current_worker
+
     def _on_fit_finished(self, success: bool, message: str) -> None:
         """Handle completion of B-spline fitting operation."""
         self.window.status_log.stop_spinner()
         self._set_buttons_enabled(True)
         
         if success:
-            params = getattr(self, '_pending_fit_params', {})
+            params = self._pending_fit_params or {}
             enforce_g2 = params.get('enforce_g2', False)
             enforce_g3 = params.get('enforce_g3', False)
             enforce_te_tangency = params.get('enforce_te_tangency', True)
@@ -182,6 +295,10 @@ class BSplineController:
             te_tangency_status = "enabled" if enforce_te_tangency else "disabled"
             self.window.status_log.append(f"B-spline fitting with G2: {g2_status}, G3: {g3_status}, TE tangency: {te_tangency_status}")
             
+            # Curves are rebuilt on every fit/refinement; drop samples and comb of the old ones
+            self._curve_sample_cache.clear()
+            self._invalidate_comb_cache()
+
             # Calculate and display errors for each surface
             upper_sum_sq, upper_max_err, upper_max_err_idx, _ = self.calculate_bspline_fitting_error(
                 self.bspline_processor.upper_curve,
@@ -218,29 +335,18 @@ class BSplineController:
             self._update_fit_button_text()
 
             # Trigger plot update with B-spline curves
-            self._update_plot_with_bsplines()
+            self._request_plot_update("bsplines")
         else:
             self.window.status_log.append(message)
         
-        # Clean up worker
-        if self._current_worker:
-            self._current_worker.deleteLater()
-            self._current_worker = None
-        
         # Clean up pending params
-        if hasattr(self, '_pending_fit_params'):
-            del self._pending_fit_params
+        self._pending_fit_params = None
     
     def _on_worker_error(self, error_message: str) -> None:
         """Handle errors from worker thread."""
         self.window.status_log.stop_spinner()
         self.window.status_log.append(error_message)
         self._set_buttons_enabled(True)
-        
-        # Clean up worker
-        if self._current_worker:
-            self._current_worker.deleteLater()
-            self._current_worker = None
     
     def _on_worker_progress(self, message: str) -> None:
         """Handle progress messages from worker thread."""
@@ -254,24 +360,35 @@ class BSplineController:
         is_file_loaded = getattr(self.processor, "upper_data", None) is not None
         is_model_built = self.bspline_processor.is_fitted()
 
-        opt.fit_bspline_button.setEnabled(enabled and is_file_loaded)
-
-        # Knot control buttons
-        opt.upper_insert_btn.setEnabled(enabled and is_model_built)
-        opt.lower_insert_btn.setEnabled(enabled and is_model_built)
-
-        # Fit-driving optimizer controls are read-only while a fit is running
-        opt.initial_cp_spin.setEnabled(enabled)
-        opt.bspline_degree_spin.setEnabled(enabled)
-        opt.smoothness_penalty_spin.setEnabled(enabled)
-        opt.g2_checkbox.setEnabled(enabled)
-        opt.g3_checkbox.setEnabled(enabled and opt.g2_checkbox.isChecked())
-        opt.enforce_te_tangency_checkbox.setEnabled(enabled)
-        opt.te_vector_points_combo.setEnabled(enabled)
+        # Skip the widget writes when nothing that drives them has changed
+        state = (enabled, is_file_loaded, is_model_built, opt.g2_checkbox.isChecked())
+        if state == self._buttons_enabled:
+            return
+        self._buttons_enabled = state
 
-        # Comb controls are read-only while a fit is running
-        self.window.comb_panel.comb_scale_slider.setEnabled(enabled and is_model_built)
-        self.window.comb_panel.comb_density_slider.setEnabled(enabled and is_model_built)
+        # Apply all state changes with a single repaint
+        self.window.setUpdatesEnabled(False)
+        try:
+            opt.fit_bspline_button.setEnabled(enabled and is_file_loaded)
+
+            # Knot control buttons
+            opt.upper_insert_btn.setEnabled(enabled and is_model_built)
+            opt.lower_insert_btn.setEnabled(enabled and is_model_built)
+
+            # Fit-driving optimizer controls are read-only while a fit is running
+            opt.initial_cp_spin.setEnabled(enabled)
+            opt.bspline_degree_spin.setEnabled(enabled)
+            opt.smoothness_penalty_spin.setEnabled(enabled)
+            opt.g2_checkbox.setEnabled(enabled)
+            opt.g3_checkbox.setEnabled(enabled and opt.g2_checkbox.isChecked())
+            opt.enforce_te_tangency_checkbox.setEnabled(enabled)
+            opt.te_vector_points_combo.setEnabled(enabled)
+
+            # Comb controls are read-only while a fit is running
+            self.window.comb_panel.comb_scale_slider.setEnabled(enabled and is_model_built)
+            self.window.comb_panel.comb_density_slider.setEnabled(enabled and is_model_built)
+        finally:
+            self.window.setUpdatesEnabled(True)
 
     def _update_fit_button_text(self) -> None:
         """Update the fit button text based on whether CP counts differ from defaults."""
@@ -297,31 +414,82 @@ class BSplineController:
             """
             Calculate fitting error for a B-spline curve against original data.
             """
-            # Approximate orthogonal by dense sampling
-            num_points_curve = config.NUM_POINTS_CURVE_ERROR
-            t_samples = np.linspace(0.0, 1.0, num_points_curve)
-            if len(t_samples) > 0:
-                t_samples[-1] = min(t_samples[-1], 1.0 - 1e-12)
-            sampled_curve_points = bspline_curve(t_samples)
-            sort_idx = np.argsort(sampled_curve_points[:, 0])
-            sampled_curve_points = sampled_curve_points[sort_idx]
-            t_sorted = t_samples[sort_idx]
-            tree = cKDTree(sampled_curve_points)
-            min_dists, nn_curve_idx = tree.query(original_data, k=1)
-            sum_sq = float(np.sum(min_dists ** 2))
+            xs, ys, t_sorted = self._sorted_curve_samples(bspline_curve)
+            out_d2, out_idx = self._error_scratch_buffers(len(original_data))
+            qx, qy = self.processor.surface_columns(original_data)
+            min_d2, nn_curve_idx = nearest_sorted_samples(xs, ys, qx, qy, out_d2, out_idx)
+            sum_sq = float(np.sum(min_d2))
+            # sqrt is monotone, so the largest squared distance locates the max error
+            max_error_idx = int(np.argmax(min_d2))
             if return_all:
-                rms = float(np.sqrt(np.mean(min_dists ** 2)))
-                return min_dists, rms, (sum_sq, int(np.argmax(min_dists)))
+                rms = float(np.sqrt(sum_sq / len(min_d2)))
+                return np.sqrt(min_d2), rms, (sum_sq, max_error_idx)
             if return_max_error:
-                max_error = float(np.max(min_dists))
-                max_error_idx = int(np.argmax(min_dists))
+                max_error = float(np.sqrt(min_d2[max_error_idx]))
                 nearest_curve_idx = int(nn_curve_idx[max_error_idx])
                 nearest_curve_idx = max(0, min(nearest_curve_idx, len(t_sorted) - 1))
                 u_at_max_error = float(t_sorted[nearest_curve_idx])
 
                 return sum_sq, max_error, max_error_idx, u_at_max_error
             return sum_sq
-    
+
+    def _error_scratch_buffers(self, num_points: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return views of length ``num_points`` into the reusable distance/index buffers."""
+        d2 = self._scratch.get("d2")
+        if d2 is None or len(d2) < num_points:
+            self._scratch["d2"] = d2 = np.empty(num_points, dtype=np.float64)
+            self._scratch["idx"] = np.empty(num_points, dtype=np.int64)
+        return d2[:num_points], self._scratch["idx"][:num_points]
+
+    def _evaluate_error_samples(self, bspline_curve: BSpline, t_samples: np.ndarray) -> np.ndarray:
+        """Evaluate the curve at the error samples as B @ c with a design matrix cached per knot vector.
+
+        Refits that keep the knot vector (parameter tweaks, TE vector changes) only pay
+        for the sparse product instead of a full de Boor evaluation.
+        """
+        from scipy.interpolate import BSpline
+
+        knots = np.asarray(bspline_curve.t, dtype=np.float64)
+        key = (knots.tobytes(), int(bspline_curve.k), len(t_samples))
+        design_matrix = self._design_matrix_cache.get(key)
+        if design_matrix is None:
+            try:
+                design_matrix = BSpline.design_matrix(t_samples, knots, bspline_curve.k).tocsr()
+            except ValueError:
+                # Samples outside the base interval: evaluate the curve directly
+                return bspline_curve(t_samples)
+            self._design_matrix_cache.put(key, design_matrix)
+        return design_matrix @ bspline_curve.c[: design_matrix.shape[1]]
+
+    def _sorted_curve_samples(self, bspline_curve: BSpline) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (xs, ys, t) of the dense error samples sorted by x, cached per curve object."""
+        # Approximate orthogonal by dense sampling
+        num_points_curve = config.NUM_POINTS_CURVE_ERROR
+        key = (id(bspline_curve), num_points_curve)
+        cached = self._curve_sample_cache.get(key, bspline_curve)
+        if cached is not None:
+            return cached
+
+        t_samples = _error_sample_parameters(num_points_curve)
+        sampled_curve_points = self._evaluate_error_samples(bspline_curve, t_samples)
+        dtype = sample_dtype()
+        xs = np.ascontiguousarray(sampled_curve_points[:, 0], dtype=dtype)
+        ys = np.ascontiguousarray(sampled_curve_points[:, 1], dtype=dtype)
+        t_sorted = t_samples
+        # Airfoil surfaces are normally monotone in x, so the parameter order already is
+        # the x order; only fall back to a full sort for curves that fold back in x.
+        if np.any(xs[1:] < xs[:-1]):
+            if config.DEBUG_WORKER_LOGGING and not self._reported_unsorted_samples:
+                print("[DEBUG] Error samples not monotone in x; sorting curve samples.")
+                self._reported_unsorted_samples = True
+            sort_idx = np.argsort(xs)
+            xs = xs[sort_idx]
+            ys = ys[sort_idx]
+            t_sorted = t_samples[sort_idx]
+
+        self._curve_sample_cache.put(key, (xs, ys, t_sorted), bspline_curve)
+        return xs, ys, t_sorted
+
 
     def apply_te_thickening(self, te_thickness_percent: float) -> bool:
         """
@@ -342,11 +510,12 @@ class BSplineController:
             te_thickness = te_thickness_percent / 100.0
             
             success = self.bspline_processor.apply_te_thickening(te_thickness)
+            self._invalidate_comb_cache()
             
             if success:
                 self.window.status_log.append(f"Applied {te_thickness_percent:.2f}% trailing edge thickness to B-splines.")
                 # Update the plot with thickened B-splines
-                self._update_plot_with_bsplines()
+                self._request_plot_update("bsplines")
                 return True
             else:
                 self.window.status_log.append("Failed to apply trailing edge thickening to B-splines.")
@@ -373,7 +542,7 @@ class BSplineController:
             if success:
                 self.window.status_log.append("Removed trailing edge thickening from B-splines.")
                 # Update the plot with sharp B-splines
-                self._update_plot_with_bsplines()
+                self._request_plot_update("bsplines")
                 return True
             else:
                 self.window.status_log.append("Failed to remove trailing edge thickening from B-splines.")
@@ -442,17 +611,57 @@ class BSplineController:
         return not self.bspline_processor.is_sharp_te
 
     
+    def _invalidate_comb_cache(self) -> None:
+        """Forget the cached curvature comb after the curves were rebuilt."""
+        self._last_comb_key = None
+        self._last_comb_value = None
+
+    def _request_plot_update(self, kind: str) -> None:
+        """Schedule a plot refresh; requests made in the same event-loop pass share one redraw.
+
+        Args:
+            kind: ``"bsplines"`` to redraw curves and comb, ``"data"`` for the input data only.
+        """
+        pending = self._pending_plot_kind
+        if pending is None:
+            QTimer.singleShot(0, self._flush_plot_update)
+        elif _PLOT_UPDATE_PRIORITY[pending] >= _PLOT_UPDATE_PRIORITY[kind]:
+            return
+        self._pending_plot_kind = kind
+
+    def _flush_plot_update(self) -> None:
+        """Run the pending plot refresh."""
+        kind, self._pending_plot_kind = self._pending_plot_kind, None
+        if kind == "bsplines":
+            self._update_plot_with_bsplines()
+        elif kind == "data":
+            self.processor.update_plot()
+
     def _update_plot_with_bsplines(self) -> None:
         """Update plot to display B-spline curves and control points."""
         # Get comb parameters from the UI
         comb_scale = self.window.comb_panel.comb_scale_slider.value() / 1000.0
         comb_density = self.window.comb_panel.comb_density_slider.value()
         
-        # Calculate B-spline comb data
-        comb_bspline = self.bspline_processor.calculate_curvature_comb_data(
-            num_points_per_segment=comb_density,
-            scale_factor=comb_scale,
-        )
+        # Reuse the comb when the curves and comb settings are unchanged (e.g. TE vector redraws)
+        bp = self.bspline_processor
+        comb_key = (bp.upper_curve, bp.lower_curve, comb_density, comb_scale)
+        last_key = self._last_comb_key
+        if (
+            last_key is not None
+            and last_key[0] is comb_key[0]
+            and last_key[1] is comb_key[1]
+            and last_key[2:] == comb_key[2:]
+        ):
+            comb_bspline = self._last_comb_value
+        else:
+            # Calculate B-spline comb data
+            comb_bspline = bp.calculate_curvature_comb_data(
+                num_points_per_segment=comb_density,
+                scale_factor=comb_scale,
+            )
+            self._last_comb_key = comb_key
+            self._last_comb_value = comb_bspline
         
         self.processor.emit_plot_update(
             bspline_processor=self.bspline_processor,
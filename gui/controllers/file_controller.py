@@ -6,22 +6,38 @@ Handles loading airfoil data files and exporting B-spline models.
 from __future__ import annotations
 
 import os
-from typing import Any
+import re
+from typing import TYPE_CHECKING, Any
 import numpy as np
 
 from PySide6.QtWidgets import QFileDialog
-from scipy import interpolate
 
 from core.airfoil_processor import AirfoilProcessor
 from core import config
-from utils.dxf_exporter import (
-    DXF_EXPORT_MODE_BEZIER,
-    DXF_EXPORT_MODE_NURBS,
-    export_bspline_to_dxf,
-)
-from utils.bsp_exporter import export_bspline_to_bsp
-from utils.bsp_importer import load_bspline_from_bsp
-from utils.data_loader import export_airfoil_to_selig_format, load_airfoil_data
+from utils.bounded_cache import BoundedCache
+
+if TYPE_CHECKING:
+    from scipy import interpolate
+
+# scipy.interpolate and the import/export helpers (ezdxf in particular) are imported
+# in the methods that use them, so they stay off the GUI start-up path.
+
+# Characters not allowed in default export filenames
+_FILENAME_SANITIZE_RE = re.compile(r"[^A-Za-z0-9\-_]+")
+# Largest float below 1.0, used as the last sampling parameter on [0, 1)
+_LAST_T_BELOW_ONE = float(np.nextafter(1.0, 0.0))
+# Number of curve-to-PPoly conversions kept (the current upper and lower surfaces)
+_PPOLY_CACHE_SIZE = 4
+
+
+def _spline_to_ppoly(knots: np.ndarray, coeffs: np.ndarray, degree: int) -> interpolate.PPoly:
+    """Convert a vector-valued B-spline (coefficients of shape (n, d)) to a PPoly."""
+    from scipy import interpolate
+
+    coeffs = np.asarray(coeffs)
+    # PPoly.from_spline only takes scalar coefficients; convert each component separately
+    parts = [interpolate.PPoly.from_spline((knots, coeffs[:, j], degree)) for j in range(coeffs.shape[1])]
+    return interpolate.PPoly(np.stack([part.c for part in parts], axis=-1), parts[0].x)
 
 
 class FileController:
@@ -31,27 +47,55 @@ class FileController:
         self.processor = processor
         self.window = window
         self.ui_state_controller = ui_state_controller
+        # The B-spline processor is created once by MainWindow/BSplineController and never replaced
+        self._bspline_proc_cache = None
+        # Piecewise-polynomial forms of sampled curves: id(curve) -> ppoly
+        self._ppoly_cache = BoundedCache(_PPOLY_CACHE_SIZE)
+        # Directory the file dialogs open in; follows the last file loaded or saved
+        self._last_dir = os.path.expanduser("~")
+
+    def _as_ppoly(self, curve: interpolate.BSpline) -> interpolate.PPoly:
+        """Return ``curve`` as a PPoly for fast dense sampling, converted once per curve object.
+
+        Curves are rebuilt (new objects) whenever the model changes, so the identity
+        check is enough to invalidate stale conversions.
+        """
+        cached = self._ppoly_cache.get(id(curve), curve)
+        if cached is not None:
+            return cached
+
+        ppoly = _spline_to_ppoly(curve.t, curve.c, curve.k)
+        self._ppoly_cache.put(id(curve), ppoly, curve)
+        return ppoly
 
     def _get_bspline_processor(self):
-        """Return the canonical B-spline processor instance."""
+        """Return the canonical B-spline processor instance (resolved once, then cached)."""
+        if self._bspline_proc_cache is not None:
+            return self._bspline_proc_cache
+
+        bspline_proc = None
         bspline_controller = getattr(self.window, "bspline_controller", None)
         if bspline_controller is not None:
             bspline_proc = getattr(bspline_controller, "bspline_processor", None)
-            if bspline_proc is not None:
-                return bspline_proc
-        return getattr(self.window, "bspline_processor", None)
+        if bspline_proc is None:
+            bspline_proc = getattr(self.window, "bspline_processor", None)
+        # Only cache a real instance, so a lookup before the controllers are wired is retried
+        if bspline_proc is not None:
+            self._bspline_proc_cache = bspline_proc
+        return bspline_proc
     
     def load_airfoil_file(self) -> None:
         """Handle loading an airfoil data file."""
         file_path, _ = QFileDialog.getOpenFileName(
             self.window,
             "Load Airfoil Data / BSP",
-            "",
+            self._last_dir,
             "Airfoil/BSP Files (*.dat *.bsp);;Airfoil Data Files (*.dat);;BSP Files (*.bsp);;All Files (*)",
         )
 
         if not file_path:
             return
+        self._last_dir = os.path.dirname(file_path)
 
         # Clear only once a new file has actually been selected
         self.window.plot_widget.clear()
@@ -90,6 +134,10 @@ class FileController:
 
     def _load_bsp_file(self, file_path: str) -> bool:
         """Load a .bsp model and hydrate processor + GUI state for inspection."""
+        from scipy import interpolate
+        from utils.bsp_importer import load_bspline_from_bsp
+        from utils.data_loader import load_airfoil_data
+
         bsp_data = load_bspline_from_bsp(file_path)
         bspline_proc = self._get_bspline_processor()
         if bspline_proc is None:
@@ -129,7 +177,11 @@ class FileController:
         bspline_proc.fitted_degree = (deg_upper, deg_lower)
         bspline_proc.num_cp_upper = int(len(upper_cp))
         bspline_proc.num_cp_lower = int(len(lower_cp))
-        bspline_proc.is_sharp_te = bool(np.allclose(upper_cp[-1], lower_cp[-1], atol=1e-12))
+        # Same tolerance as np.allclose(atol=1e-12): |a - b| <= atol + rtol * |b|, rtol = 1e-5
+        (ux, uy), (lx, ly) = upper_cp[-1].tolist(), lower_cp[-1].tolist()
+        bspline_proc.is_sharp_te = (
+            abs(ux - lx) <= 1e-12 + 1e-5 * abs(lx) and abs(uy - ly) <= 1e-12 + 1e-5 * abs(ly)
+        )
         bspline_proc.fitted = True
 
         # Prefer sibling DAT (same stem) as reference/source data for error calculations.
@@ -154,10 +206,9 @@ class FileController:
                     f"Warning: Could not load matching DAT '{os.path.basename(ref_dat_path)}': {exc}. "
                     "Falling back to BSP-sampled reference data."
                 )
-                upper_data, lower_data = self._sample_bsp_curves(upper_curve, lower_curve)
-                self.processor.airfoil_name = bsp_data.airfoil_name or os.path.splitext(os.path.basename(file_path))[0]
-                self.processor._is_blunt_TE = not bspline_proc.is_sharp_te
-        else:
+        if not has_reference_data:
+            # The sampled points still serve as plot data, TE-tangent source and refit input,
+            # but they lie on the curves by construction, so no error metrics are computed.
             upper_data, lower_data = self._sample_bsp_curves(upper_curve, lower_curve)
             self.processor.airfoil_name = bsp_data.airfoil_name or os.path.splitext(os.path.basename(file_path))[0]
             self.processor._is_blunt_TE = not bspline_proc.is_sharp_te
@@ -231,22 +282,30 @@ class FileController:
     def _sample_bsp_curves(self, upper_curve, lower_curve) -> tuple[np.ndarray, np.ndarray]:
         sample_count = max(200, int(config.PLOT_POINTS_PER_SURFACE))
         t_values = np.linspace(0.0, 1.0, sample_count)
-        if len(t_values) > 0:
-            t_values[-1] = min(t_values[-1], 1.0 - 1e-12)
-        return upper_curve(t_values), lower_curve(t_values)
+        if len(t_values) > 1:
+            # linspace ends exactly at 1.0; step just inside the last knot span
+            t_values[-1] = _LAST_T_BELOW_ONE
+        if upper_curve.k == lower_curve.k and np.array_equal(upper_curve.t, lower_curve.t):
+            # Shared knots: evaluate both surfaces as one 4-component spline, so the
+            # interval search and polynomial evaluation run once for both.
+            both = _spline_to_ppoly(
+                upper_curve.t,
+                np.hstack((np.asarray(upper_curve.c), np.asarray(lower_curve.c))),
+                upper_curve.k,
+            )(t_values)
+            return both[:, :2], both[:, 2:]
+        return self._as_ppoly(upper_curve)(t_values), self._as_ppoly(lower_curve)(t_values)
 
     def _find_matching_dat_for_bsp(self, bsp_path: str) -> str | None:
         bsp = os.path.abspath(bsp_path)
         base_dir = os.path.dirname(bsp)
-        stem = os.path.splitext(os.path.basename(bsp))[0].lower()
+        target = os.path.splitext(os.path.basename(bsp))[0].lower() + ".dat"
         try:
-            for name in os.listdir(base_dir):
-                path = os.path.join(base_dir, name)
-                if not os.path.isfile(path):
-                    continue
-                file_stem, ext = os.path.splitext(name)
-                if ext.lower() == ".dat" and file_stem.lower() == stem:
-                    return path
+            # DirEntry carries the file type from the listing, so no per-file stat is needed
+            with os.scandir(base_dir) as entries:
+                for entry in entries:
+                    if entry.name.lower() == target and entry.is_file():
+                        return entry.path
         except OSError:
             return None
         return None
@@ -256,15 +315,11 @@ class FileController:
         """Export the current B-spline model as a DXF file."""
         # Check if B-spline is available and fitted
         bspline_proc = self._get_bspline_processor()
-        bspline_fitted = False
-        if bspline_proc is not None:
-            try:
-                bspline_fitted = bool(getattr(bspline_proc, "fitted", False))
-            except Exception:
-                bspline_fitted = False
+        fitted = bool(getattr(bspline_proc, "fitted", False))
+        upper_cp = getattr(bspline_proc, "upper_control_points", None)
+        lower_cp = getattr(bspline_proc, "lower_control_points", None)
 
-        if not bspline_fitted or getattr(bspline_proc, "upper_control_points", None) is None or \
-           getattr(bspline_proc, "lower_control_points", None) is None:
+        if not (fitted and upper_cp is not None and lower_cp is not None):
             self.processor.log_message.emit(
                 "Error: B-spline model not available for export. Please fit B-spline first."
             )
@@ -293,6 +348,12 @@ class FileController:
             )
             return
 
+        from utils.dxf_exporter import (
+            DXF_EXPORT_MODE_BEZIER,
+            DXF_EXPORT_MODE_NURBS,
+            export_bspline_to_dxf,
+        )
+
         export_mode = DXF_EXPORT_MODE_NURBS
         file_panel = getattr(self.window, "file_panel", None)
         if file_panel is not None:
@@ -317,15 +378,25 @@ class FileController:
         file_path, _ = QFileDialog.getSaveFileName(
             self.window,
             "Save B-spline DXF File",
-            default_filename,
+            os.path.join(self._last_dir, default_filename),
             "DXF Files (*.dxf)",
         )
         if not file_path:
             self.processor.log_message.emit("B-spline DXF export cancelled by user.")
             return
+        self._last_dir = os.path.dirname(file_path)
 
         try:
-            dxf_doc.saveas(file_path)
+            # Same encoding/error handling as Drawing.saveas, but through a 1 MiB buffer
+            with open(
+                file_path,
+                "wt",
+                encoding=dxf_doc.output_encoding,
+                errors="dxfreplace",
+                buffering=1 << 20,
+            ) as stream:
+                dxf_doc.write(stream)
+            dxf_doc.filename = file_path
             self.processor.log_message.emit(
                 f"B-spline DXF export successful to '{os.path.basename(file_path)}'."
             )
@@ -337,11 +408,9 @@ class FileController:
     
     def _get_default_dxf_filename(self) -> str:
         """Return a safe default filename based on the loaded profile."""
-        import re
-
         profile_name = getattr(self.processor, "airfoil_name", None)
         if profile_name:
-            sanitized = re.sub(r"[^A-Za-z0-9\-_]+", "_", profile_name)
+            sanitized = _FILENAME_SANITIZE_RE.sub("_", profile_name)
             if sanitized:
                 return f"{sanitized}.dxf"
         return "airfoil.dxf" 
@@ -368,13 +437,11 @@ class FileController:
 
         # Check if B-spline is available and fitted
         bspline_proc = self._get_bspline_processor()
-        try:
-            bspline_fitted = bool(getattr(bspline_proc, "fitted", False))
-        except Exception:
-            bspline_fitted = False
+        fitted = bool(getattr(bspline_proc, "fitted", False))
+        upper_curve = getattr(bspline_proc, "upper_curve", None)
+        lower_curve = getattr(bspline_proc, "lower_curve", None)
 
-        if not bspline_fitted or getattr(bspline_proc, "upper_curve", None) is None or \
-           getattr(bspline_proc, "lower_curve", None) is None:
+        if not (fitted and upper_curve is not None and lower_curve is not None):
             self.processor.log_message.emit(
                 "Error: B-spline model not available for export. Please fit B-spline first."
             )
@@ -382,10 +449,11 @@ class FileController:
 
         try:
             t_values = np.linspace(0.0, 1.0, points_per_surface)
-            if len(t_values) > 0:
-                t_values[-1] = min(t_values[-1], 1.0 - 1e-12)
-            upper_points = bspline_proc.upper_curve(t_values)
-            lower_points = bspline_proc.lower_curve(t_values)
+            if len(t_values) > 1:
+                # linspace ends exactly at 1.0; step just inside the last knot span
+                t_values[-1] = _LAST_T_BELOW_ONE
+            upper_points = self._as_ppoly(upper_curve)(t_values)
+            lower_points = self._as_ppoly(lower_curve)(t_values)
 
             # Default filename
             default_filename = self._get_default_dat_filename(f"{airfoil_name}_bspline")
@@ -393,14 +461,21 @@ class FileController:
             file_path, _ = QFileDialog.getSaveFileName(
                 self.window,
                 "Save B-spline High-Resolution .dat File",
-                default_filename,
+                os.path.join(self._last_dir, default_filename),
                 "DAT Files (*.dat);;All Files (*)",
             )
             if not file_path:
                 self.processor.log_message.emit(".dat export cancelled by user.")
                 return
+            self._last_dir = os.path.dirname(file_path)
+
+            from utils.data_loader import export_airfoil_to_selig_format_soa
 
-            export_airfoil_to_selig_format(upper_points, lower_points, airfoil_name, file_path)
+            export_airfoil_to_selig_format_soa(
+                upper_points[:, 0], upper_points[:, 1],
+                lower_points[:, 0], lower_points[:, 1],
+                airfoil_name, file_path,
+            )
             self.processor.log_message.emit(
                 f"B-spline .dat export successful to '{os.path.basename(file_path)}'."
             )
@@ -414,10 +489,8 @@ class FileController:
 
     def _get_default_dat_filename(self, airfoil_name: str) -> str:
         """Return a safe default filename for .dat export based on the loaded profile."""
-        import re
-
         if airfoil_name:
-            sanitized = re.sub(r"[^A-Za-z0-9\-_]+", "_", airfoil_name)
+            sanitized = _FILENAME_SANITIZE_RE.sub("_", airfoil_name)
             if sanitized:
                 return f"{sanitized}_highres.dat"
         return "airfoil_highres.dat"
@@ -429,12 +502,7 @@ class FileController:
             return
 
         bspline_proc = self._get_bspline_processor()
-        try:
-            bspline_fitted = bool(getattr(bspline_proc, "fitted", False))
-        except Exception:
-            bspline_fitted = False
-
-        if not bspline_fitted:
+        if not bool(getattr(bspline_proc, "fitted", False)):
             self.processor.log_message.emit(
                 "Error: B-spline model not available for export. Please fit B-spline first."
             )
@@ -446,12 +514,15 @@ class FileController:
         file_path, _ = QFileDialog.getSaveFileName(
             self.window,
             "Save B-spline .bsp File",
-            default_filename,
+            os.path.join(self._last_dir, default_filename),
             "BSP Files (*.bsp);;All Files (*)",
         )
         if not file_path:
             self.processor.log_message.emit(".bsp export cancelled by user.")
             return
+        self._last_dir = os.path.dirname(file_path)
+
+        from utils.bsp_exporter import export_bspline_to_bsp
 
         ok = export_bspline_to_bsp(
             bspline_proc,
@@ -468,10 +539,8 @@ class FileController:
 
     def _get_default_bsp_filename(self, airfoil_name: str) -> str:
         """Return a safe default filename for .bsp export based on the loaded profile."""
-        import re
-
         if airfoil_name:
-            sanitized = re.sub(r"[^A-Za-z0-9\-_]+", "_", airfoil_name)
+            sanitized = _FILENAME_SANITIZE_RE.sub("_", airfoil_name)
             if sanitized:
                 return f"{sanitized}.bsp"
         return "airfoil.bsp"
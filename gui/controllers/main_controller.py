@@ -5,6 +5,7 @@ Orchestrates the other controllers and handles signal routing between GUI and pr
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from PySide6.QtCore import QObject
@@ -57,55 +58,58 @@ class MainController(QObject):
 
     def _connect_signals(self) -> None:
         """Connect all GUI signals to their respective controller methods."""
-        # File operations
         fp = self.window.file_panel
-        fp.load_button.clicked.connect(self.file_controller.load_airfoil_file)
-        fp.export_dxf_button.clicked.connect(self.file_controller.export_dxf)
-        fp.export_bsp_button.clicked.connect(self.file_controller.export_bsp_file)
-        fp.export_dat_button.clicked.connect(self.file_controller.export_dat_file)
-
-        # Optimization operations
         opt = self.window.optimizer_panel
-        opt.fit_bspline_button.clicked.connect(self.bspline_controller.fit_bspline)
-        opt.upper_insert_btn.clicked.connect(lambda: self.bspline_controller.insert_knot('upper'))
-        opt.lower_insert_btn.clicked.connect(lambda: self.bspline_controller.insert_knot('lower'))
-        
-        # Parameter changes that trigger re-fit (only if already fitted)
-        opt.bspline_degree_spin.valueChanged.connect(self.bspline_controller.refit_if_fitted)
-        opt.smoothness_penalty_spin.valueChanged.connect(self.bspline_controller.refit_if_fitted)
-        opt.g2_checkbox.toggled.connect(self.bspline_controller.refit_if_fitted)
-        opt.g3_checkbox.toggled.connect(self.bspline_controller.refit_if_fitted)
-        opt.enforce_te_tangency_checkbox.toggled.connect(self.bspline_controller.refit_if_fitted)
-        
-        # TE vector points dropdown - always updates TE vectors, refits only if tangency enabled and fitted
-        opt.te_vector_points_combo.currentIndexChanged.connect(self.bspline_controller.handle_te_vector_points_changed)
-
-
-        # Airfoil settings
         airfoil = self.window.airfoil_settings_panel
-        airfoil.toggle_thickening_button.clicked.connect(self.ui_state_controller.handle_toggle_thickening)
-        airfoil.te_thickness_input.textChanged.connect(self.ui_state_controller.handle_thickness_input_changed)
-
-        # Comb parameters
         comb = self.window.comb_panel
-        comb.comb_scale_slider.valueChanged.connect(self.ui_state_controller.handle_comb_params_changed)
-        comb.comb_density_slider.valueChanged.connect(self.ui_state_controller.handle_comb_params_changed)
+        files = self.file_controller
+        bspline = self.bspline_controller
+        ui_state = self.ui_state_controller
+
+        bindings = (
+            # File operations
+            (fp.load_button.clicked, files.load_airfoil_file),
+            (fp.export_dxf_button.clicked, files.export_dxf),
+            (fp.export_bsp_button.clicked, files.export_bsp_file),
+            (fp.export_dat_button.clicked, files.export_dat_file),
+            # Optimization operations
+            (opt.fit_bspline_button.clicked, bspline.fit_bspline),
+            (opt.upper_insert_btn.clicked, functools.partial(bspline.insert_knot, 'upper')),
+            (opt.lower_insert_btn.clicked, functools.partial(bspline.insert_knot, 'lower')),
+            # Parameter changes that trigger re-fit (only if already fitted)
+            (opt.bspline_degree_spin.valueChanged, bspline.refit_if_fitted),
+            (opt.smoothness_penalty_spin.valueChanged, bspline.refit_if_fitted),
+            (opt.g2_checkbox.toggled, bspline.refit_if_fitted),
+            (opt.g3_checkbox.toggled, bspline.refit_if_fitted),
+            (opt.enforce_te_tangency_checkbox.toggled, bspline.refit_if_fitted),
+            # TE vector points dropdown - always updates TE vectors, refits only if tangency enabled and fitted
+            (opt.te_vector_points_combo.currentIndexChanged, bspline.handle_te_vector_points_changed),
+            # Airfoil settings
+            (airfoil.toggle_thickening_button.clicked, ui_state.handle_toggle_thickening),
+            (airfoil.te_thickness_input.textChanged, ui_state.handle_thickness_input_changed),
+            # Comb parameters
+            (comb.comb_scale_slider.valueChanged, ui_state.handle_comb_params_changed),
+            (comb.comb_density_slider.valueChanged, ui_state.handle_comb_params_changed),
+        )
+        for signal, slot in bindings:
+            signal.connect(slot)
 
     def _update_plot_from_processor(self, plot_data: dict[str, Any]) -> None:
         """Receive plot data from the processor and forward to the widget."""
-        # Cache so we can recompute comb later
-        self._last_plot_data = plot_data.copy()
+        # Cache so we can recompute comb later; every payload is a fresh dict, so keep a reference
+        self._last_plot_data = plot_data
 
         try:
             chord_length_mm = float(self.window.airfoil_settings_panel.chord_length_input.text())
         except Exception:
             chord_length_mm = None
 
-        # Remove chord_length_mm from plot_data to avoid duplicate parameter
-        plot_data_without_chord = {k: v for k, v in plot_data.items() if k != 'chord_length_mm'}
+        # Remove chord_length_mm from plot_data to avoid duplicate parameter (payloads normally lack it)
+        if 'chord_length_mm' in plot_data:
+            plot_data = {k: v for k, v in plot_data.items() if k != 'chord_length_mm'}
         
         self.window.plot_widget.plot_airfoil(
-            **plot_data_without_chord,
+            **plot_data,
             chord_length_mm=chord_length_mm,
         )
 
@@ -148,8 +148,8 @@ class UIStateController:
             # Update B-spline comb if B-spline model is present
             bspline_proc = self._get_bspline_processor()
             if bspline_proc is not None and bspline_proc.is_fitted():
-                # Trigger B-spline plot update with new comb parameters
-                self.window.bspline_controller._update_plot_with_bsplines()
+                # Trigger B-spline plot update with new comb parameters (coalesced with other redraws)
+                self.window.bspline_controller._request_plot_update("bsplines")
     
     def handle_toggle_thickening(self) -> None:
         """Apply/remove trailing-edge thickening for B-spline models."""
@@ -0,0 +1,52 @@
+"""Numeric kernels for the curvature-comb display.
+
+The tip-outline filter runs as a compiled loop when Numba is available (see
+:mod:`core._numba_support`), otherwise vectorised in NumPy.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+from core._numba_support import jit
+
+
+def _tip_outline_pairs_numpy(tips: np.ndarray) -> np.ndarray:
+    keep = (tips[:-1, 1] != 0) | (tips[1:, 1] != 0)
+    return np.stack((tips[:-1][keep], tips[1:][keep]), axis=1).reshape(-1, 2)
+
+
+def _tip_outline_pairs_loop(tips):
+    """Single pass over consecutive tips, writing kept pairs into a preallocated buffer."""
+    n = tips.shape[0]
+    out = np.empty((2 * max(n - 1, 0), 2), dtype=tips.dtype)
+    m = 0
+    for i in range(n - 1):
+        if tips[i, 1] != 0 or tips[i + 1, 1] != 0:
+            out[m, 0] = tips[i, 0]
+            out[m, 1] = tips[i, 1]
+            out[m + 1, 0] = tips[i + 1, 0]
+            out[m + 1, 1] = tips[i + 1, 1]
+            m += 2
+    return out[:m]
+
+
+_tip_outline_pairs_jit = jit(_tip_outline_pairs_loop, lambda: (np.ones((3, 2)),))
+
+
+def tip_outline_pairs(tips: np.ndarray) -> np.ndarray:
+    """
+    Line segments joining consecutive comb tips, for a ``connect="pairs"`` plot.
+
+    Pairs where both tips lie on y == 0 are skipped.
+
+    Args:
+        tips: (N, 2) array of comb tip points of one surface.
+
+    Returns:
+        (2M, 2) array of segment endpoints.
+    """
+    tips = np.ascontiguousarray(tips, dtype=np.float64)
+    if _tip_outline_pairs_jit is not None:
+        return _tip_outline_pairs_jit(tips)
+    return _tip_outline_pairs_numpy(tips)
+
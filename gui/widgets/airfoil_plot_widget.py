@@ -7,14 +7,19 @@ of the GUI refactor (2025-07-17).
 
 from __future__ import annotations
 
+import functools
+
 import numpy as np
 import pyqtgraph as pg
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from core.config import (
     PLOT_POINTS_PER_SURFACE,
 )
 
+from utils.bounded_cache import BoundedCache
+from ._comb_kernels import tip_outline_pairs
+
 
 KEY_ORIGINAL_DATA = "Original Data"
 KEY_BSPLINE_CURVES = "B-spline Curves"
@@ -28,6 +33,62 @@ KEY_BSPLINE_ERROR_TEXT = "B-spline Error Text"
 KEY_BSPLINE_MAX_ERROR_MARKERS = "B-spline Max. Error Markers"
 KEY_GEOMETRY_METRICS_TEXT = "Geometry Metrics Text"
 
+_SPAN_DESIGN_MATRIX_CACHE_SIZE = 4
+
+# Coalescing interval for overlay-text repositioning during pan/zoom (about one frame)
+_TEXT_POSITION_UPDATE_MS = 16
+
+# HTML templates for the overlay texts, filled with str.format on each redraw
+_ERROR_TEXT_TEMPLATE = '<div style="text-align: right; color: #FF6B6B; font-size: 10pt;">{cp_info}{errors}</div>'
+_ERROR_BOTH_TEMPLATE = (
+    "B-spline Max Error (Upper/Lower): "
+    "{upper:.2e} ({upper_mm:.3f} mm) / {lower:.2e} ({lower_mm:.3f} mm)"
+)
+_ERROR_SINGLE_TEMPLATE = "B-spline Max Error ({surface}): {error:.2e} ({error_mm:.3f} mm)"
+# Control-point line of the error text, keyed by (upper known, lower known, counts equal)
+_CP_INFO_TEMPLATES = {
+    (True, True, True): "Control Points: {upper}<br/>",
+    (True, True, False): "Control Points: Upper={upper}, Lower={lower}<br/>",
+    (True, False, False): "Control Points (Upper): {upper}<br/>",
+    (False, True, False): "Control Points (Lower): {lower}<br/>",
+    (False, False, False): "",
+}
+_GEOMETRY_TEXT_TEMPLATE = (
+    '<div style="text-align: right; color: #F0E68C; font-size: 10pt;">'
+    "Thickness: {t_pct:.2f}% (x: {x_t:.1f}%)<br/>"
+    "Camber: {c_pct:.2f}% (x: {x_c:.1f}%)<br/>"
+    "TE wedge: {wedge:.2f}&deg;<br/>"
+    "LE Radius: {le_r:.3f}%"
+    "</div>"
+)
+
+# Vertex type for sampled B-spline display geometry. SciPy evaluates splines in float64;
+# the fitted model itself stays float64 for refits and exports.
+_DISPLAY_DTYPE = np.float32
+
+
+@functools.lru_cache(maxsize=32)
+def _span_sample_fractions(num_spans: int) -> np.ndarray:
+    """Read-only relative sample positions within one knot span, for a curve with ``num_spans`` spans."""
+    fractions = np.linspace(0.0, 1.0, max(5, PLOT_POINTS_PER_SURFACE // num_spans))
+    fractions.setflags(write=False)
+    return fractions
+
+
+def _distinct_active_knots(curve) -> np.ndarray:
+    """Distinct knots of the curve's active parameter range, in ascending order.
+
+    Knot vectors are non-decreasing, so duplicates are adjacent and one linear pass replaces a sort.
+    """
+    k = curve.k
+    active_knots = curve.t[k : len(curve.t) - k]
+    if len(active_knots) == 0:
+        return active_knots
+    keep = np.empty(len(active_knots), dtype=bool)
+    keep[0] = True
+    np.greater(active_knots[1:], active_knots[:-1], out=keep[1:])
+    return active_knots[keep]
+
 
 class AirfoilPlotWidget(pg.PlotWidget):
     """Custom `pyqtgraph.PlotWidget` tailored for airfoil visualisation."""
@@ -41,17 +102,31 @@ class AirfoilPlotWidget(pg.PlotWidget):
         )
         self.updateGeometry()
 
-        pg.setConfigOptions(antialias=True)
         self.setAspectLocked(True)
         self.showGrid(x=True, y=True)
         self.addLegend(offset=(30, 10))
         self.setLabel("bottom", "x/c (Chord)")
         self.setLabel("left", "y/c (Chord)")
 
+        # Pens and brushes are never mutated, so one set serves every redraw
+        self._palette = self._build_palette()
         self.plot_items: dict[str, object] = {}
-        self._item_visibility_by_name: dict[str, bool] = {}
+        # Items are created once per slot and updated in place on later redraws. Items whose
+        # layer is absent from a redraw are detached, not destroyed, so legend visibility
+        # toggles survive until the item is shown again.
+        self._item_pool: dict[object, object] = {}
+        self._text_html: dict[object, str] = {}
+        # Span-sampling design matrices keyed by (knot bytes, degree)
+        self._span_design_matrices = BoundedCache(_SPAN_DESIGN_MATRIX_CACHE_SIZE)
+        self._drawn_slots: set[object] = set()
         self._first_plot_done = False
-        self.getViewBox().sigRangeChanged.connect(self._update_error_text_positions)
+        self._view_box = self.getViewBox()
+        # Pan/zoom emits range changes in bursts; reposition the overlay texts at most once per frame
+        self._text_position_timer = QTimer(self)
+        self._text_position_timer.setSingleShot(True)
+        self._text_position_timer.setInterval(_TEXT_POSITION_UPDATE_MS)
+        self._text_position_timer.timeout.connect(self._update_error_text_positions)
+        self._view_box.sigRangeChanged.connect(self._schedule_error_text_positions)
 
     def plot_airfoil(
         self,
@@ -75,47 +150,56 @@ class AirfoilPlotWidget(pg.PlotWidget):
         bspline_num_cp_lower=None,
     ):
         """Render current airfoil and optional B-spline layers."""
-        palette = self._build_palette()
-        self._capture_visibility_state()
-        self._reset_plot_canvas()
-
-        self._plot_original_data(upper_data, lower_data, palette)
-        self._plot_bspline_layers(
-            bspline_upper_curve,
-            bspline_lower_curve,
-            bspline_upper_control_points,
-            bspline_lower_control_points,
-            bspline_is_blunt,
-            palette,
-        )
-        self._plot_curvature_comb(comb_bspline, palette)
-        self._plot_te_tangent_vectors(
-            upper_data,
-            lower_data,
-            upper_te_tangent_vector,
-            lower_te_tangent_vector,
-            palette,
-        )
-        self._plot_error_annotations(
-            upper_data,
-            lower_data,
-            chord_length_mm,
-            bspline_upper_max_error,
-            bspline_lower_max_error,
-            bspline_upper_max_error_idx,
-            bspline_lower_max_error_idx,
-            bspline_num_cp_upper,
-            bspline_num_cp_lower,
-        )
-        self._plot_geometry_metrics(geometry_metrics)
+        palette = self._palette
+        self.plot_items = {}
+        self._drawn_slots = set()
+
+        # Repaint once after all layers are updated instead of per item change
+        self.setUpdatesEnabled(False)
+        try:
+            self._plot_original_data(upper_data, lower_data, palette)
+            self._plot_bspline_layers(
+                bspline_upper_curve,
+                bspline_lower_curve,
+                bspline_upper_control_points,
+                bspline_lower_control_points,
+                bspline_is_blunt,
+                palette,
+            )
+            self._plot_curvature_comb(comb_bspline, palette)
+            self._plot_te_tangent_vectors(
+                upper_data,
+                lower_data,
+                upper_te_tangent_vector,
+                lower_te_tangent_vector,
+                palette,
+            )
+            self._plot_error_annotations(
+                upper_data,
+                lower_data,
+                chord_length_mm,
+                bspline_upper_max_error,
+                bspline_lower_max_error,
+                bspline_upper_max_error_idx,
+                bspline_lower_max_error_idx,
+                bspline_num_cp_upper,
+                bspline_num_cp_lower,
+            )
+            self._plot_geometry_metrics(geometry_metrics)
 
-        self._update_error_text_positions()
-        self._restore_visibility_state()
-        self._set_initial_view_range_if_needed(upper_data, lower_data)
+            for slot, item in self._item_pool.items():
+                if slot not in self._drawn_slots:
+                    self.removeItem(item)
+
+            self._update_error_text_positions()
+            self._set_initial_view_range_if_needed(upper_data, lower_data)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _build_palette(self) -> dict[str, object]:
         return {
-            "original_data": (100, 149, 237, 220),
+            "original_data": pg.mkBrush((100, 149, 237, 220)),
+            "original_data_pen": pg.mkPen((200, 200, 200)),
             "te_tangent_upper": pg.mkPen((220, 20, 60), width=2, style=Qt.PenStyle.SolidLine),
             "te_tangent_lower": pg.mkPen((138, 43, 226), width=2, style=Qt.PenStyle.SolidLine),
             "comb": pg.mkPen((150, 150, 150), width=1.5),
@@ -132,12 +216,43 @@ class AirfoilPlotWidget(pg.PlotWidget):
             "control_blunt_pen": pg.mkPen((148, 0, 211), width=1.5),
             "knot_pen": pg.mkPen((255, 215, 0), width=1.5),
             "knot_brush": pg.mkBrush((255, 215, 0, 220)),
+            "max_error_marker": pg.mkPen((255, 165, 0), width=3),
         }
 
-    def _reset_plot_canvas(self) -> None:
-        self.clear()
-        self.addLegend(offset=(30, 10))
-        self.plot_items = {}
+    def _attach_slot(self, slot, item) -> None:
+        # Membership is checked on the PlotItem because clear() can detach items externally
+        if item not in self.getPlotItem().items:
+            self.addItem(item)
+        self._drawn_slots.add(slot)
+
+    def _show_plot_data(self, slot, x, y, *, item_type=pg.PlotDataItem, **style):
+        """Set the data of the pooled item for ``slot`` and attach it.
+
+        ``item_type`` and ``style`` are only used when the item is first created,
+        so every slot must map to a fixed type, style and legend name.
+        """
+        item = self._item_pool.get(slot)
+        if item is None:
+            item = item_type(x, y, **style)
+            self._item_pool[slot] = item
+        else:
+            item.setData(x, y)
+        self._attach_slot(slot, item)
+        return item
+
+    def _show_text(self, slot, html: str):
+        """Set the HTML of the pooled top-right-anchored text item for ``slot`` and attach it."""
+        item = self._item_pool.get(slot)
+        if item is None:
+            item = pg.TextItem(html=html, anchor=(1, 1))
+            self._item_pool[slot] = item
+            self._text_html[slot] = html
+        elif self._text_html.get(slot) != html:
+            # Rich-text layout is the expensive part; skip it when the text is unchanged
+            item.setHtml(html)
+            self._text_html[slot] = html
+        self._attach_slot(slot, item)
+        return item
 
     def _register_item(self, key: str, item, *, is_group: bool = False) -> None:
         if is_group:
@@ -148,14 +263,22 @@ class AirfoilPlotWidget(pg.PlotWidget):
         self.plot_items[key] = item
 
     def _plot_original_data(self, upper_data, lower_data, palette: dict[str, object]) -> None:
-        all_original_data = np.concatenate([upper_data, lower_data])
-        item = self.plot(
-            all_original_data[:, 0],
-            all_original_data[:, 1],
-            pen=None,
+        # Point order is irrelevant for a scatter, so join the columns directly
+        x = np.concatenate((upper_data[:, 0], lower_data[:, 0]))
+        y = np.concatenate((upper_data[:, 1], lower_data[:, 1]))
+        # Symbols only: a bare ScatterPlotItem with a pixmap-cached symbol skips the
+        # PlotDataItem curve machinery
+        item = self._show_plot_data(
+            KEY_ORIGINAL_DATA,
+            x,
+            y,
+            item_type=pg.ScatterPlotItem,
             symbol="o",
-            symbolSize=5,
-            symbolBrush=pg.mkBrush(palette["original_data"]),
+            size=5,
+            pen=palette["original_data_pen"],
+            brush=palette["original_data"],
+            pxMode=True,
+            useCache=True,
             name=KEY_ORIGINAL_DATA,
         )
         self._register_item(KEY_ORIGINAL_DATA, item)
@@ -192,11 +315,13 @@ class AirfoilPlotWidget(pg.PlotWidget):
         for curve, surface_name in ((bspline_upper_curve, "Upper"), (bspline_lower_curve, "Lower")):
             if curve is None:
                 continue
-            self._plot_bspline_curve_spans(curve, surface_name, curve_pens, curve_name_prefix)
-            self._plot_bspline_knot_markers(curve, surface_name, palette)
+            unique_knots = _distinct_active_knots(curve)
+            self._plot_bspline_curve_spans(curve, unique_knots, surface_name, curve_pens, curve_name_prefix)
+            self._plot_bspline_knot_markers(curve, unique_knots, surface_name, palette)
 
         if bspline_upper_control_points is not None:
-            item = self.plot(
+            item = self._show_plot_data(
+                (KEY_BSPLINE_CONTROL_POINTS, curve_name_prefix, "Upper"),
                 bspline_upper_control_points[:, 0],
                 bspline_upper_control_points[:, 1],
                 pen=control_pen,
@@ -209,7 +334,8 @@ class AirfoilPlotWidget(pg.PlotWidget):
             self._register_item(KEY_BSPLINE_CONTROL_POINTS, item, is_group=True)
 
         if bspline_lower_control_points is not None:
-            item = self.plot(
+            item = self._show_plot_data(
+                (KEY_BSPLINE_CONTROL_POINTS, curve_name_prefix, "Lower"),
                 bspline_lower_control_points[:, 0],
                 bspline_lower_control_points[:, 1],
                 pen=control_pen,
@@ -221,23 +347,20 @@ class AirfoilPlotWidget(pg.PlotWidget):
             )
             self._register_item(KEY_BSPLINE_CONTROL_POINTS, item, is_group=True)
 
-    def _plot_bspline_curve_spans(self, curve, surface_name: str, curve_pens: list[object], curve_name_prefix: str) -> None:
-        knots = curve.t
-        k = curve.k
-        active_knots = knots[k : len(knots) - k]
-        unique_knots = np.unique(active_knots)
-
-        for idx in range(len(unique_knots) - 1):
-            t_start = unique_knots[idx]
-            t_end = unique_knots[idx + 1]
-            num_points_span = max(5, PLOT_POINTS_PER_SURFACE // (len(unique_knots) - 1))
-            t_vals = np.linspace(t_start, t_end, num_points_span)
-            if t_end == unique_knots[-1]:
-                t_vals[-1] = min(t_vals[-1], unique_knots[-1] - 1e-12)
-
-            span_points = curve(t_vals)
+    def _plot_bspline_curve_spans(
+        self, curve, unique_knots, surface_name: str, curve_pens: list[object], curve_name_prefix: str
+    ) -> None:
+        num_spans = len(unique_knots) - 1
+        if num_spans < 1:
+            return
+        num_points_span = len(_span_sample_fractions(num_spans))
+        all_points = self._sample_spans(curve, unique_knots).astype(_DISPLAY_DTYPE, copy=False)
+
+        for idx in range(num_spans):
+            span_points = all_points[idx * num_points_span : (idx + 1) * num_points_span]
             name = f"{curve_name_prefix} {surface_name}" if idx == 0 else None
-            item = self.plot(
+            item = self._show_plot_data(
+                (KEY_BSPLINE_CURVES, curve_name_prefix, surface_name, idx),
                 span_points[:, 0],
                 span_points[:, 1],
                 pen=curve_pens[idx % 2],
@@ -246,13 +369,36 @@ class AirfoilPlotWidget(pg.PlotWidget):
             )
             self._register_item(KEY_BSPLINE_CURVES, item, is_group=True)
 
-    def _plot_bspline_knot_markers(self, curve, surface_name: str, palette: dict[str, object]) -> None:
-        knots = curve.t
-        k = curve.k
-        active_knots = knots[k : len(knots) - k]
-        unique_knots = np.unique(active_knots)
-        knot_points = curve(unique_knots)
-        item = self.plot(
+    def _sample_spans(self, curve, unique_knots) -> np.ndarray:
+        """Evaluate ``curve`` on the span sample grid as B @ c, with B cached per knot vector.
+
+        During fitting only the control points change between redraws, so the sparse
+        basis is built once per knot vector (and shared by surfaces with equal knots).
+        """
+        from scipy.interpolate import BSpline
+
+        knots = np.asarray(curve.t, dtype=np.float64)
+        key = (knots.tobytes(), int(curve.k))
+        design_matrix = self._span_design_matrices.get(key)
+        if design_matrix is None:
+            fractions = _span_sample_fractions(len(unique_knots) - 1)
+            # Sample every span (both ends included, so adjacent spans meet)
+            span_starts = unique_knots[:-1, np.newaxis]
+            t_grid = span_starts + (unique_knots[1:, np.newaxis] - span_starts) * fractions
+            t_grid[:, -1] = unique_knots[1:]
+            t_vals = t_grid.ravel()
+            t_vals[-1] = np.nextafter(unique_knots[-1], -np.inf)
+            try:
+                design_matrix = BSpline.design_matrix(t_vals, knots, curve.k).tocsr()
+            except ValueError:
+                return curve(t_vals)
+            self._span_design_matrices.put(key, design_matrix)
+        return design_matrix @ np.asarray(curve.c)[: design_matrix.shape[1]]
+
+    def _plot_bspline_knot_markers(self, curve, unique_knots, surface_name: str, palette: dict[str, object]) -> None:
+        knot_points = curve(unique_knots).astype(_DISPLAY_DTYPE, copy=False)
+        item = self._show_plot_data(
+            (KEY_BSPLINE_KNOT_MARKERS, surface_name),
             knot_points[:, 0],
             knot_points[:, 1],
             pen=None,
@@ -265,29 +411,26 @@ class AirfoilPlotWidget(pg.PlotWidget):
         self._register_item(KEY_BSPLINE_KNOT_MARKERS, item, is_group=True)
 
     def _plot_curvature_comb(self, comb_bspline, palette: dict[str, object]) -> None:
-        if comb_bspline is None or not any(comb_bspline):
+        if comb_bspline is None:
             return
 
-        all_hairs: list[np.ndarray] = []
-        all_tip_segments: list[np.ndarray] = []
-        for comb_segments in comb_bspline:
-            if not comb_segments:
-                continue
-            all_hairs.extend(comb_segments)
-
-            comb_tips = np.array([hair[1] for hair in comb_segments])
-            for idx in range(len(comb_tips) - 1):
-                p1 = comb_tips[idx]
-                p2 = comb_tips[idx + 1]
-                if p1[1] != 0 or p2[1] != 0:
-                    all_tip_segments.append(p1)
-                    all_tip_segments.append(p2)
-
-        if not all_hairs:
+        # One (H, 2, 2) array of [base, tip] hairs per surface; the comb data already
+        # arrives in that layout, so these are views
+        surface_hairs = [
+            np.asarray(comb_segments, dtype=float).reshape(-1, 2, 2)
+            for comb_segments in comb_bspline
+            if len(comb_segments)
+        ]
+        if not surface_hairs:
             return
 
-        comb_array = np.concatenate(all_hairs)
-        main_item = self.plot(
+        # Tip outline segments join consecutive tips of the same surface, skipping
+        # pairs where both tips lie on y == 0
+        tips_array = np.concatenate([tip_outline_pairs(hairs[:, 1]) for hairs in surface_hairs])
+
+        comb_array = np.concatenate(surface_hairs).reshape(-1, 2)
+        main_item = self._show_plot_data(
+            KEY_BSPLINE_COMB,
             comb_array[:, 0],
             comb_array[:, 1],
             pen=palette["comb"],
@@ -296,11 +439,12 @@ class AirfoilPlotWidget(pg.PlotWidget):
         )
         self._register_item(KEY_BSPLINE_COMB, main_item, is_group=True)
 
-        if not all_tip_segments:
+        if not len(tips_array):
             return
 
-        tips_array = np.array(all_tip_segments)
-        tips_item = self.plot(
+        tips_created = KEY_BSPLINE_COMB_TIPS not in self._item_pool
+        tips_item = self._show_plot_data(
+            KEY_BSPLINE_COMB_TIPS,
             tips_array[:, 0],
             tips_array[:, 1],
             pen=palette["comb_outline"],
@@ -308,10 +452,16 @@ class AirfoilPlotWidget(pg.PlotWidget):
         )
         self._register_item(KEY_BSPLINE_COMB_TIPS, tips_item, is_group=True)
 
-        main_item.visibleChanged.connect(
-            lambda: tips_item.setVisible(main_item.isVisible())
-        )
-        tips_item.setVisible(main_item.isVisible())
+        if tips_created:
+            main_item.visibleChanged.connect(self._sync_comb_tips_visibility)
+        self._sync_comb_tips_visibility()
+
+    def _sync_comb_tips_visibility(self) -> None:
+        """Show the comb tip outline exactly when the comb itself is visible (toggled via its legend entry)."""
+        main_item = self._item_pool.get(KEY_BSPLINE_COMB)
+        tips_item = self._item_pool.get(KEY_BSPLINE_COMB_TIPS)
+        if main_item is not None and tips_item is not None:
+            tips_item.setVisible(main_item.isVisible())
 
     def _plot_te_tangent_vectors(
         self,
@@ -327,24 +477,23 @@ class AirfoilPlotWidget(pg.PlotWidget):
             return
 
         tangent_length = 0.05
-        upper_te_point = upper_data[-1]
-        lower_te_point = lower_data[-1]
-
-        tangent_start_upper = upper_te_point - upper_te_tangent_vector * tangent_length
-        tangent_end_upper = upper_te_point + upper_te_tangent_vector * tangent_length
-        upper_item = self.plot(
-            [tangent_start_upper[0], tangent_end_upper[0]],
-            [tangent_start_upper[1], tangent_end_upper[1]],
+        (upper_x, upper_y), (lower_x, lower_y) = upper_data[-1].tolist(), lower_data[-1].tolist()
+        upper_dx, upper_dy = (float(v) * tangent_length for v in upper_te_tangent_vector)
+        lower_dx, lower_dy = (float(v) * tangent_length for v in lower_te_tangent_vector)
+
+        upper_item = self._show_plot_data(
+            KEY_TE_TANGENT_UPPER,
+            [upper_x - upper_dx, upper_x + upper_dx],
+            [upper_y - upper_dy, upper_y + upper_dy],
             pen=palette["te_tangent_upper"],
             name=KEY_TE_TANGENT_UPPER,
         )
         self._register_item(KEY_TE_TANGENT_UPPER, upper_item)
 
-        tangent_start_lower = lower_te_point - lower_te_tangent_vector * tangent_length
-        tangent_end_lower = lower_te_point + lower_te_tangent_vector * tangent_length
-        lower_item = self.plot(
-            [tangent_start_lower[0], tangent_end_lower[0]],
-            [tangent_start_lower[1], tangent_end_lower[1]],
+        lower_item = self._show_plot_data(
+            KEY_TE_TANGENT_LOWER,
+            [lower_x - lower_dx, lower_x + lower_dx],
+            [lower_y - lower_dy, lower_y + lower_dy],
             pen=palette["te_tangent_lower"],
             name=KEY_TE_TANGENT_LOWER,
         )
@@ -363,27 +512,27 @@ class AirfoilPlotWidget(pg.PlotWidget):
         bspline_num_cp_lower,
     ) -> None:
         if chord_length_mm is not None and (max_bspline_upper is not None or max_bspline_lower is not None):
-            error_html = '<div style="text-align: right; color: #FF6B6B; font-size: 10pt;">'
-            error_html += self._build_cp_info_html(bspline_num_cp_upper, bspline_num_cp_lower)
-
             if max_bspline_upper is not None and max_bspline_lower is not None:
-                max_upper_mm = max_bspline_upper * chord_length_mm
-                max_lower_mm = max_bspline_lower * chord_length_mm
-                error_html += (
-                    "B-spline Max Error (Upper/Lower): "
-                    f"{max_bspline_upper:.2e} ({max_upper_mm:.3f} mm) / "
-                    f"{max_bspline_lower:.2e} ({max_lower_mm:.3f} mm)"
+                errors = _ERROR_BOTH_TEMPLATE.format(
+                    upper=max_bspline_upper,
+                    upper_mm=max_bspline_upper * chord_length_mm,
+                    lower=max_bspline_lower,
+                    lower_mm=max_bspline_lower * chord_length_mm,
                 )
             elif max_bspline_upper is not None:
-                max_upper_mm = max_bspline_upper * chord_length_mm
-                error_html += f"B-spline Max Error (Upper): {max_bspline_upper:.2e} ({max_upper_mm:.3f} mm)"
-            elif max_bspline_lower is not None:
-                max_lower_mm = max_bspline_lower * chord_length_mm
-                error_html += f"B-spline Max Error (Lower): {max_bspline_lower:.2e} ({max_lower_mm:.3f} mm)"
-
-            error_html += "</div>"
-            text_item = pg.TextItem(html=error_html, anchor=(1, 1))
-            self.addItem(text_item)
+                errors = _ERROR_SINGLE_TEMPLATE.format(
+                    surface="Upper", error=max_bspline_upper, error_mm=max_bspline_upper * chord_length_mm
+                )
+            else:
+                errors = _ERROR_SINGLE_TEMPLATE.format(
+                    surface="Lower", error=max_bspline_lower, error_mm=max_bspline_lower * chord_length_mm
+                )
+
+            error_html = _ERROR_TEXT_TEMPLATE.format(
+                cp_info=self._build_cp_info_html(bspline_num_cp_upper, bspline_num_cp_lower),
+                errors=errors,
+            )
+            text_item = self._show_text(KEY_BSPLINE_ERROR_TEXT, error_html)
             self._register_item(KEY_BSPLINE_ERROR_TEXT, text_item)
 
         marker_x: list[float] = []
@@ -398,61 +547,54 @@ class AirfoilPlotWidget(pg.PlotWidget):
             marker_y.append(pt[1])
 
         if marker_x:
-            marker_item = self.plot(
+            marker_item = self._show_plot_data(
+                KEY_BSPLINE_MAX_ERROR_MARKERS,
                 marker_x,
                 marker_y,
                 pen=None,
                 symbol="s",
                 symbolSize=16,
                 symbolBrush=None,
-                symbolPen=pg.mkPen((255, 165, 0), width=3),
+                symbolPen=self._palette["max_error_marker"],
                 name=KEY_BSPLINE_MAX_ERROR_MARKERS,
             )
             self._register_item(KEY_BSPLINE_MAX_ERROR_MARKERS, marker_item)
 
     @staticmethod
     def _build_cp_info_html(bspline_num_cp_upper, bspline_num_cp_lower) -> str:
-        if bspline_num_cp_upper is not None and bspline_num_cp_lower is not None:
-            if bspline_num_cp_upper == bspline_num_cp_lower:
-                return f"Control Points: {bspline_num_cp_upper}<br/>"
-            return f"Control Points: Upper={bspline_num_cp_upper}, Lower={bspline_num_cp_lower}<br/>"
-        if bspline_num_cp_upper is not None:
-            return f"Control Points (Upper): {bspline_num_cp_upper}<br/>"
-        if bspline_num_cp_lower is not None:
-            return f"Control Points (Lower): {bspline_num_cp_lower}<br/>"
-        return ""
+        has_upper = bspline_num_cp_upper is not None
+        has_lower = bspline_num_cp_lower is not None
+        same = has_upper and has_lower and bspline_num_cp_upper == bspline_num_cp_lower
+        return _CP_INFO_TEMPLATES[has_upper, has_lower, same].format(
+            upper=bspline_num_cp_upper, lower=bspline_num_cp_lower
+        )
 
     def _plot_geometry_metrics(self, geometry_metrics) -> None:
         if not geometry_metrics:
             return
 
-        t_pct = geometry_metrics.get("thickness_percent")
-        c_pct = geometry_metrics.get("camber_percent")
-        wedge = geometry_metrics.get("te_wedge_angle_deg")
-        le_r = geometry_metrics.get("le_radius_percent")
-        x_t = geometry_metrics.get("x_t_percent", 0.0)
-        x_c = geometry_metrics.get("x_c_percent", 0.0)
-        geo_html = (
-            '<div style="text-align: right; color: #F0E68C; font-size: 10pt;">'
-            f"Thickness: {t_pct:.2f}% (x: {x_t:.1f}%)<br/>"
-            f"Camber: {c_pct:.2f}% (x: {x_c:.1f}%)<br/>"
-            f"TE wedge: {wedge:.2f}&deg;<br/>"
-            f"LE Radius: {le_r:.3f}%"
-            "</div>"
+        geo_html = _GEOMETRY_TEXT_TEMPLATE.format(
+            t_pct=geometry_metrics.get("thickness_percent"),
+            c_pct=geometry_metrics.get("camber_percent"),
+            wedge=geometry_metrics.get("te_wedge_angle_deg"),
+            le_r=geometry_metrics.get("le_radius_percent"),
+            x_t=geometry_metrics.get("x_t_percent", 0.0),
+            x_c=geometry_metrics.get("x_c_percent", 0.0),
         )
-        geo_item = pg.TextItem(html=geo_html, anchor=(1, 1))
-        self.addItem(geo_item)
+        geo_item = self._show_text(KEY_GEOMETRY_METRICS_TEXT, geo_html)
         self._register_item(KEY_GEOMETRY_METRICS_TEXT, geo_item)
 
     def _set_initial_view_range_if_needed(self, upper_data, lower_data) -> None:
         if self._first_plot_done:
             return
 
-        all_x = np.concatenate([upper_data[:, 0], lower_data[:, 0]])
-        all_y = np.concatenate([upper_data[:, 1], lower_data[:, 1]])
-
-        x_min, x_max = float(np.min(all_x)), float(np.max(all_x))
-        y_min, y_max = float(np.min(all_y)), float(np.max(all_y))
+        # Column-wise bounds of each surface, folded together without concatenating
+        upper_min, upper_max = upper_data.min(axis=0), upper_data.max(axis=0)
+        lower_min, lower_max = lower_data.min(axis=0), lower_data.max(axis=0)
+        x_min = float(min(upper_min[0], lower_min[0]))
+        x_max = float(max(upper_max[0], lower_max[0]))
+        y_min = float(min(upper_min[1], lower_min[1]))
+        y_max = float(max(upper_max[1], lower_max[1]))
 
         x_padding = (x_max - x_min) * 0.1
         y_padding = (y_max - y_min) * 0.2
@@ -461,43 +603,13 @@ class AirfoilPlotWidget(pg.PlotWidget):
         self.setYRange(y_min - y_padding, y_max + y_padding)
         self._first_plot_done = True
 
-    def _iter_plot_items(self):
-        """Yield all plot-backed items currently tracked in `self.plot_items`."""
-        for entry in self.plot_items.values():
-            if isinstance(entry, list):
-                for item in entry:
-                    yield item
-            elif entry is not None:
-                yield entry
-
-    @staticmethod
-    def _item_name(item) -> str | None:
-        """Return the plot item legend name when available."""
-        if hasattr(item, "opts") and isinstance(item.opts, dict):
-            name = item.opts.get("name")
-            if name:
-                return str(name)
-        return None
-
-    def _capture_visibility_state(self) -> None:
-        """Capture visibility per named plot item before clearing/replotting."""
-        for item in self._iter_plot_items():
-            name = self._item_name(item)
-            if name and hasattr(item, "isVisible"):
-                self._item_visibility_by_name[name] = bool(item.isVisible())
-
-    def _restore_visibility_state(self) -> None:
-        """Reapply captured visibility to newly created named items."""
-        if not self._item_visibility_by_name:
-            return
-        for item in self._iter_plot_items():
-            name = self._item_name(item)
-            if name and name in self._item_visibility_by_name and hasattr(item, "setVisible"):
-                item.setVisible(self._item_visibility_by_name[name])
+    def _schedule_error_text_positions(self, *_args) -> None:
+        if not self._text_position_timer.isActive():
+            self._text_position_timer.start()
 
     def _update_error_text_positions(self):
         """Keep error text anchored to the top-right corner on zoom/pan."""
-        vb = self.getViewBox()
+        vb = self._view_box
         if not vb:
             return
 
@@ -17,6 +17,9 @@ from PySide6.QtCore import Qt
 
 from core import config
 
+_BUTTON_MIN_WIDTH = 120
+
+
 class FileControlPanel(QGroupBox):
     """Panel containing *Load* and *Export* actions for airfoil files."""
 
@@ -25,24 +28,27 @@ class FileControlPanel(QGroupBox):
 
         # --- Widgets -----------------------------------------------------
         self.load_button = QPushButton("Load Airfoil File")
-        self.load_button.setMinimumWidth(120)  # Give button a minimum width
         self.file_path_label = QLabel("No file loaded")
         
         self.export_dxf_button = QPushButton("Export DXF")
-        self.export_dxf_button.setMinimumWidth(120)  # Give button a minimum width
         self.export_dxf_as_bezier_checkbox = QCheckBox("As Bezier")
         self.export_dxf_as_bezier_checkbox.setToolTip(
             "When enabled, DXF export decomposes each B-spline into piecewise Bezier segments."
         )
 
         self.export_bsp_button = QPushButton("Export BSP")
-        self.export_bsp_button.setMinimumWidth(120)  # Give button a minimum width
 
         self.export_dat_button = QPushButton("Export DAT")
-        self.export_dat_button.setMinimumWidth(120)  # Give button a minimum width
-        
 
-        
+        # Give the action buttons a common minimum width
+        for button in (
+            self.load_button,
+            self.export_dxf_button,
+            self.export_bsp_button,
+            self.export_dat_button,
+        ):
+            button.setMinimumWidth(_BUTTON_MIN_WIDTH)
+
         self.points_per_surface_label = QLabel("Points per surface:")
         self.points_per_surface_input = QSpinBox()
         self.points_per_surface_input.setMinimum(10)
@@ -15,6 +15,7 @@ from PySide6.QtWidgets import (
     QSpinBox,
     QDoubleSpinBox,
 )
+from PySide6.QtCore import QSignalBlocker
 
 from core import config
 
@@ -184,10 +185,9 @@ class OptimizerSettingsWidget(QGroupBox):
     def _update_g2_from_g3(self):
         """When G3 is checked, automatically check G2 if not already checked."""
         if self.g3_checkbox.isChecked() and not self.g2_checkbox.isChecked():
-            # Temporarily disconnect to avoid recursion
-            self.g2_checkbox.blockSignals(True)
-            self.g2_checkbox.setChecked(True)
-            self.g2_checkbox.blockSignals(False)
+            # Block G2's signals to avoid recursion; the blocker restores them even on error
+            with QSignalBlocker(self.g2_checkbox):
+                self.g2_checkbox.setChecked(True)
             self._update_g3_checkbox_state()  # Update G3 state (should enable it) 
 
     def _sync_initial_cp_min(self) -> None:
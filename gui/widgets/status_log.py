@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from PySide6.QtWidgets import QTextEdit, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QLabel, QTextEdit, QVBoxLayout, QWidget
 from PySide6.QtGui import QFont
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import Qt, QTimer
+
+_SPINNER_INTERVAL_MS = 125
+# Oldest log lines are discarded beyond this many, bounding memory and layout cost
+_MAX_LOG_LINES = 5000
 
 
 class StatusLogWidget(QWidget):
@@ -16,6 +20,7 @@ class StatusLogWidget(QWidget):
         self._text_edit = QTextEdit()
         self._text_edit.setReadOnly(True)
         self._text_edit.setFont(QFont("Monospace", 9))
+        self._text_edit.document().setMaximumBlockCount(_MAX_LOG_LINES)
 
         # Spinner state
         self._spinner_active = False
@@ -23,10 +28,17 @@ class StatusLogWidget(QWidget):
         self._spinner_frame = 0
         self._spinner_chars = ["|", "/", "-", "\\"]
         self._spinner_timer = QTimer(self)
-        self._spinner_timer.timeout.connect(self._update_spinner)
+        self._spinner_timer.setInterval(_SPINNER_INTERVAL_MS)
+        # Timer and widget share the GUI thread, so the tick can be delivered directly
+        self._spinner_timer.timeout.connect(self._update_spinner, Qt.ConnectionType.DirectConnection)
+        # The spinner lives in its own label so animating it never touches the log document
+        self._spinner_label = QLabel("")
+        self._spinner_label.setFont(QFont("Monospace", 9))
+        self._spinner_label.hide()
 
         layout = QVBoxLayout()
         layout.addWidget(self._text_edit)
+        layout.addWidget(self._spinner_label)
         self.setLayout(layout)
 
     # ------------------------------------------------------------------
@@ -34,13 +46,7 @@ class StatusLogWidget(QWidget):
     # ------------------------------------------------------------------
     def append(self, text: str) -> None:  # noqa: D401 (docstring style)
         """Append *text* to the log display."""
-        # If spinner is active, remove the spinner line first
-        if self._spinner_active:
-            self._remove_spinner_line()
         self._text_edit.append(text)
-        # Re-add spinner if it was active
-        if self._spinner_active:
-            self._add_spinner_line()
 
     def clear(self) -> None:
         """Clear the log widget."""
@@ -58,96 +64,24 @@ class StatusLogWidget(QWidget):
         self._spinner_active = True
         self._spinner_message = message
         self._spinner_frame = 0
-        self._add_spinner_line()
-        self._spinner_timer.start(100)  # Update every 100ms
-    
+        self._show_spinner_frame()
+        self._spinner_label.show()
+        self._spinner_timer.start()
+
     def stop_spinner(self) -> None:
         """Stop the spinner animation."""
         if self._spinner_active:
             self._spinner_active = False
             self._spinner_timer.stop()
-            self._remove_spinner_line()
-    
-    def _add_spinner_line(self) -> None:
-        """Add the spinner line at the end of the log."""
-        spinner_char = self._spinner_chars[self._spinner_frame % len(self._spinner_chars)]
-        spinner_text = f"{self._spinner_message} {spinner_char}"
-        
-        # Use cursor to add spinner line without extra newline from append()
-        cursor = self._text_edit.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        
-        # Check if we need to add a newline before the spinner
-        # Only add newline if document is not empty and last character is not a newline
-        text = self._text_edit.toPlainText()
-        if text and not text.endswith('\n'):
-            cursor.insertText('\n')
-        elif not text:
-            # Empty document, no newline needed
-            pass
-        # If text ends with newline, cursor is already positioned correctly
-        
-        # Insert the spinner text (without trailing newline - QTextEdit handles that)
-        cursor.insertText(spinner_text)
-        
-        # Move cursor to end and scroll
-        cursor.movePosition(cursor.MoveOperation.End)
-        self._text_edit.setTextCursor(cursor)
-    
-    def _update_spinner_line(self) -> None:
-        """Update the spinner line in place without removing/re-adding."""
+            self._spinner_label.hide()
+
+    def _show_spinner_frame(self) -> None:
+        """Show the current spinner frame in the spinner label."""
         spinner_char = self._spinner_chars[self._spinner_frame % len(self._spinner_chars)]
-        spinner_text = f"{self._spinner_message} {spinner_char}"
-        
-        cursor = self._text_edit.textCursor()
-        # Move to the end of the document
-        cursor.movePosition(cursor.MoveOperation.End)
-        
-        # Move to the start of the last line (the spinner line)
-        cursor.movePosition(cursor.MoveOperation.StartOfLine)
-        # Select to the end of the line (not including the newline)
-        cursor.movePosition(cursor.MoveOperation.EndOfLine, cursor.MoveMode.KeepAnchor)
-        
-        # Replace the selected text (the spinner line content) with the new spinner text
-        cursor.insertText(spinner_text)
-        
-        # Move cursor back to end and scroll
-        cursor.movePosition(cursor.MoveOperation.End)
-        self._text_edit.setTextCursor(cursor)
-    
-    def _remove_spinner_line(self) -> None:
-        """Remove the last line (spinner) from the log."""
-        text = self._text_edit.toPlainText()
-        if not text.strip():
-            # Empty log, nothing to remove
-            return
-        
-        # Use cursor to remove the last line, including the newline before it
-        cursor = self._text_edit.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        
-        # Move to start of last line (the spinner line)
-        cursor.movePosition(cursor.MoveOperation.StartOfLine)
-        
-        # If not at the start of document, move left to include the newline before this line
-        start_pos = cursor.position()
-        if start_pos > 0:
-            cursor.movePosition(cursor.MoveOperation.Left)
-        
-        # Select from this position (newline before spinner, or start of doc) to the end
-        cursor.movePosition(cursor.MoveOperation.End, cursor.MoveMode.KeepAnchor)
-        
-        # Remove the selected text
-        cursor.removeSelectedText()
-        
-        # Set cursor back to end
-        cursor.movePosition(cursor.MoveOperation.End)
-        self._text_edit.setTextCursor(cursor)
-    
+        self._spinner_label.setText(f"{self._spinner_message} {spinner_char}")
+
     def _update_spinner(self) -> None:
         """Update the spinner animation frame."""
         if self._spinner_active:
             self._spinner_frame += 1
-            self._update_spinner_line()
-
- 
\ No newline at end of file
+            self._show_spinner_frame()
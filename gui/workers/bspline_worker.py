@@ -1,14 +1,39 @@
-"""Worker thread for B-spline fitting operations."""
+"""Worker for B-spline fitting operations."""
 
 from __future__ import annotations
 
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 import numpy as np
 from core.bspline_processor import BSplineProcessor
 
 
-class BSplineWorker(QThread):
-    """Worker thread for performing B-spline fitting operations without blocking the UI."""
+def _readonly_view(values: np.ndarray | None) -> np.ndarray | None:
+    """Zero-copy, read-only C-contiguous view of ``values`` (the caller's array stays writable)."""
+    if values is None:
+        return None
+    view = np.ascontiguousarray(values).view()
+    view.flags.writeable = False
+    return view
+
+
+class _BSplineTask(QRunnable):
+    """Runnable that executes one queued worker operation on the pool thread."""
+
+    def __init__(self, worker: BSplineWorker):
+        super().__init__()
+        self._worker = worker
+
+    def run(self) -> None:
+        self._worker.run()
+
+
+class BSplineWorker(QObject):
+    """Long-lived worker performing B-spline operations without blocking the UI.
+
+    Operations run on a private single-thread ``QThreadPool``, so the thread is
+    created once and reused for every fit. Signals are emitted from the pool
+    thread and delivered to GUI-thread receivers as queued calls.
+    """
     
     # Signals emitted when operations complete
     finished = Signal(bool, str)  # success: bool, message: str
@@ -18,6 +43,13 @@ class BSplineWorker(QThread):
     def __init__(self, bspline_processor: BSplineProcessor, parent=None):
         super().__init__(parent)
         self.bspline_processor = bspline_processor
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pool.setExpiryTimeout(-1)  # keep the thread alive between fits
+        self._running = False
+        # Connected first, so the flag is cleared on the GUI thread before other receivers run
+        self.finished.connect(self._on_operation_done)
+        self.error.connect(self._on_operation_done)
         self.operation_type = None  # 'fit' or 'insert_knot'
         
         # Parameters for fitting operation
@@ -47,14 +79,18 @@ class BSplineWorker(QThread):
         enforce_g3: bool,
         enforce_te_tangency: bool,
     ):
-        """Set up parameters for a B-spline fitting operation."""
+        """Set up parameters for a B-spline fitting operation.
+
+        The arrays are shared with the caller as read-only views rather than copied;
+        the caller replaces rather than mutates them while :meth:`isRunning` is True.
+        """
         self.operation_type = 'fit'
-        self.upper_data = upper_data.copy()
-        self.lower_data = lower_data.copy()
+        self.upper_data = _readonly_view(upper_data)
+        self.lower_data = _readonly_view(lower_data)
         self.num_control_points = num_control_points
         self.is_thickened = is_thickened
-        self.upper_te_tangent_vector = upper_te_tangent_vector.copy() if upper_te_tangent_vector is not None else None
-        self.lower_te_tangent_vector = lower_te_tangent_vector.copy() if lower_te_tangent_vector is not None else None
+        self.upper_te_tangent_vector = _readonly_view(upper_te_tangent_vector)
+        self.lower_te_tangent_vector = _readonly_view(lower_te_tangent_vector)
         self.enforce_g2 = enforce_g2
         self.enforce_g3 = enforce_g3
         self.enforce_te_tangency = enforce_te_tangency
@@ -69,6 +105,18 @@ class BSplineWorker(QThread):
         self.knot_u_value = knot_u_value
         self.target_surface = target_surface
     
+    def start(self) -> None:
+        """Queue the configured operation on the worker thread."""
+        self._running = True
+        self._pool.start(_BSplineTask(self))
+
+    def isRunning(self) -> bool:
+        """Return True while a queued operation has not finished yet."""
+        return self._running
+
+    def _on_operation_done(self, *_args) -> None:
+        self._running = False
+
     def run(self) -> None:
         """Execute the operation in the worker thread."""
         try:
@@ -1,23 +1,53 @@
 import sys
 import os
 import multiprocessing
+from PySide6.QtCore import QEvent, QObject, QTimer
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication
-from gui.main_window import MainWindow
-from gui.controllers import MainController
+from core import config
+
+# Resource root: the PyInstaller bundle directory when frozen, else this file's directory
+_BASE_DIR = getattr(sys, '_MEIPASS', None) or os.path.dirname(os.path.abspath(__file__))
 
 
 def resource_path(relative_path: str) -> str:
     """Get absolute path to resource, works for dev and for PyInstaller bundle."""
-    if hasattr(sys, '_MEIPASS'):
-        # Running as PyInstaller bundle
-        return os.path.join(sys._MEIPASS, relative_path)
-    return os.path.join(os.path.dirname(os.path.abspath(__file__)), relative_path)
+    return os.path.join(_BASE_DIR, relative_path)
+
+
+class _AfterFirstPaint(QObject):
+    """Event filter that schedules ``callback`` once its watched widget has painted."""
+
+    def __init__(self, widget, callback) -> None:
+        super().__init__(widget)
+        self._callback = callback
+        widget.installEventFilter(self)
+
+    def eventFilter(self, watched, event) -> bool:
+        if event.type() == QEvent.Type.Paint:
+            watched.removeEventFilter(self)
+            QTimer.singleShot(0, self._callback)
+        return False
 
 
 def main() -> None:
     """Launch the Qt GUI application."""
+    # User overrides must be in place before GUI modules bind config values.
+    config.ensure_loaded()
+    from gui.main_window import MainWindow
+    from gui.controllers import MainController
+
     app = QApplication(sys.argv)
+    # pyqtgraph options are process-wide; set them once before any plot widget exists
+    import pyqtgraph as pg
+    use_opengl = config.PLOT_USE_OPENGL
+    if use_opengl:
+        try:
+            import OpenGL  # noqa: F401 - pyqtgraph's GL curve path needs PyOpenGL
+        except ImportError:
+            print("[config] PLOT_USE_OPENGL is set but PyOpenGL is not installed; using raster drawing.")
+            use_opengl = False
+    pg.setConfigOptions(antialias=True, useOpenGL=use_opengl)
     
     icon_path = resource_path('img/favicon.ico')
     if os.path.exists(icon_path):
@@ -26,6 +56,12 @@ def main() -> None:
     window = MainWindow()
     controller = MainController(window)
     window.show()
+
+    # Compile (or load from cache) the optional Numba kernels once the window has been
+    # painted. This stays on the GUI thread: a parallel kernel first run from a worker
+    # thread can leave Numba's TBB threading layer hanging at interpreter exit.
+    from core import _numba_support
+    _AfterFirstPaint(window, _numba_support.warm_up)
     sys.exit(app.exec())
 
 
@@ -1,9 +1,11 @@
+import fnmatch
 import os
+import re
+import string
 import uuid
 import hashlib
 import argparse
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
 
 BASE_EXCLUDED_DIRS = {
     '__pycache__',
@@ -24,16 +26,30 @@ EXCLUDED_FILES = {
     '*cwd'
 }
 
+# EXCLUDED_FILES mixes literal names and glob patterns: literals are a set lookup,
+# the globs are compiled once into a single case-sensitive regex
+_GLOB_CHARS = set("*?[")
+_EXCLUDED_LITERALS = {name for name in EXCLUDED_FILES if _GLOB_CHARS.isdisjoint(name)}
+_EXCLUDED_GLOB_RE = re.compile("|".join(
+    fnmatch.translate(pattern) for pattern in sorted(EXCLUDED_FILES - _EXCLUDED_LITERALS)
+) or r"(?!)")
+
+
+def is_excluded_file(filename):
+    return filename in _EXCLUDED_LITERALS or _EXCLUDED_GLOB_RE.match(filename) is not None
+
+# ASCII characters that are not allowed in WiX ids map to "_"
+_ID_ALLOWED_ASCII = set(string.ascii_letters + string.digits + "._")
+_ID_TRANSLATION = str.maketrans({chr(c): "_" for c in range(128) if chr(c) not in _ID_ALLOWED_ASCII})
+
+
 def make_id(prefix, path):
-    raw = path.replace(os.sep, "_")
-    safe_chars = []
-    for ch in raw:
-        if ch.isalnum() or ch in "._":
-            safe_chars.append(ch)
-        else:
-            safe_chars.append("_")
-    safe_path = "".join(safe_chars)
-    if not safe_path or not (safe_path[0].isalpha() or safe_path[0] == "_"):
+    safe_path = path.replace(os.sep, "_").translate(_ID_TRANSLATION)
+    if not safe_path.isascii():
+        # Rare non-ASCII names: keep Unicode alphanumerics like the ASCII table does
+        safe_path = "".join(ch if ch.isalnum() or ch in "._" else "_" for ch in safe_path)
+    first = safe_path[:1]
+    if not (first.isalpha() or first == "_"):
         safe_path = f"_{safe_path}"
     full_id = f"{prefix}_{safe_path}"
     if len(full_id) <= 72:
@@ -42,12 +58,6 @@ def make_id(prefix, path):
     return f"{prefix}_{hash_str}"
 
 
-def should_exclude_dir(dirpath, source_dir, excluded_dirs):
-    rel_path = os.path.relpath(dirpath, source_dir)
-    parts = rel_path.split(os.sep)
-    return any(part in excluded_dirs for part in parts)
-
-
 def generate_wxs_fragment(source_dir, output_file, component_group_id, directory_id_root):
     setup_dir = os.path.dirname(os.path.abspath(output_file))
     source_dir_abs = os.path.abspath(source_dir)
@@ -66,58 +76,66 @@ def generate_wxs_fragment(source_dir, output_file, component_group_id, directory
     dir_map = {".": directory_id_root, "": directory_id_root}
     file_count = 0
 
+    # One walk collects the kept directories and their files; components are emitted afterwards
+    relpath = os.path.relpath
+    walked = []
+    total_files = 0
+    # Pruning dirnames in place keeps the walk out of excluded directories, so every
+    # dirpath it yields is already kept (the root itself is never excluded)
     for dirpath, dirnames, filenames in os.walk(source_dir):
-        if should_exclude_dir(dirpath, source_dir, excluded_dirs):
-            continue
         dirnames[:] = [d for d in dirnames if d not in excluded_dirs]
-        rel_path = os.path.relpath(dirpath, source_dir)
-        if rel_path in [".", ""]:
-            continue
-        dir_id = make_id("DIR", rel_path)
-        dir_map[rel_path] = dir_id
+        rel_path = relpath(dirpath, source_dir)
+        if rel_path not in (".", ""):
+            dir_map[rel_path] = make_id("DIR", rel_path)
+        kept_files = [filename for filename in filenames if not is_excluded_file(filename)]
+        walked.append((rel_path, kept_files))
+        total_files += len(kept_files)
 
     comp_group = ET.SubElement(fragment, "ComponentGroup", Id=component_group_id)
 
-    for dirpath, dirnames, filenames in os.walk(source_dir):
-        if should_exclude_dir(dirpath, source_dir, excluded_dirs):
-            continue
-        dirnames[:] = [d for d in dirnames if d not in excluded_dirs]
-        rel_path = os.path.relpath(dirpath, source_dir)
+    # Entropy for all component GUIDs in one read; each 16-byte slice becomes a version-4 UUID
+    guid_bytes = os.urandom(16 * total_files)
+    make_uuid = uuid.UUID
+    sub_element = ET.SubElement
+
+    for rel_path, filenames in walked:
         dir_id = dir_map.get(rel_path, directory_id_root)
 
         for filename in filenames:
-            if filename in EXCLUDED_FILES:
-                continue
-            file_path = os.path.join(dirpath, filename)
-            rel_file_path = os.path.relpath(file_path, source_dir)
+            # rel_path is already normalised, so plain concatenation equals relpath(join(...))
+            rel_file_path = filename if rel_path in (".", "") else f"{rel_path}{os.sep}{filename}"
 
             comp_id = make_id("CMP", rel_file_path)
             file_id = make_id("FILE", rel_file_path)
 
-            comp = ET.SubElement(comp_group, "Component",
-                                 Id=comp_id,
-                                 Guid=str(uuid.uuid4()).upper(),
-                                 Directory=dir_id)
+            offset = 16 * file_count
+            guid = make_uuid(bytes=guid_bytes[offset:offset + 16], version=4)
+
+            comp = sub_element(comp_group, "Component",
+                               Id=comp_id,
+                               Guid=str(guid).upper(),
+                               Directory=dir_id)
 
-            ET.SubElement(comp, "RegistryValue",
-                          Root="HKCU",
-                          Key=f"Software\\AirfoilFitter\\Files\\{file_id}",
-                          Name="installed",
-                          Type="integer",
-                          Value="1",
-                          Action="write")
+            sub_element(comp, "RegistryValue",
+                        Root="HKCU",
+                        Key=f"Software\\AirfoilFitter\\Files\\{file_id}",
+                        Name="installed",
+                        Type="integer",
+                        Value="1",
+                        Action="write")
 
             file_source_path = f"{source_dir_rel}/{rel_file_path.replace(os.sep, '/')}"
             file_source_path = file_source_path.replace('\\', '/').replace('//', '/')
-            ET.SubElement(comp, "File",
-                          Id=file_id,
-                          Source=file_source_path,
-                          KeyPath="yes")
+            sub_element(comp, "File",
+                        Id=file_id,
+                        Source=file_source_path,
+                        KeyPath="yes")
             file_count += 1
 
     dir_fragment = ET.SubElement(root, "Fragment")
 
-    sorted_dir_items = sorted(dir_map.items(), key=lambda x: x[0].count(os.sep) if os.sep in x[0] else x[0].count("/"))
+    # Parents before children: os.walk joins relative paths with os.sep, so its count is the depth
+    sorted_dir_items = sorted(dir_map.items(), key=lambda item: item[0].count(os.sep))
     for rel_path, dir_id in sorted_dir_items:
         if rel_path in [".", ""]:
             continue
@@ -126,10 +144,8 @@ def generate_wxs_fragment(source_dir, output_file, component_group_id, directory
         p_ref = ET.SubElement(dir_fragment, "DirectoryRef", Id=parent_id)
         ET.SubElement(p_ref, "Directory", Id=dir_id, Name=os.path.basename(rel_path))
 
-    xml_str = ET.tostring(root, encoding='unicode')
-    xml_dom = minidom.parseString(xml_str)
-    with open(output_file, "w", encoding="utf-8") as f:
-        f.write(xml_dom.toprettyxml(indent="    "))
+    ET.indent(root, space="    ")
+    ET.ElementTree(root).write(output_file, encoding="utf-8", xml_declaration=True)
 
     print(f"Generated {output_file} with {file_count} files.")
 
@@ -0,0 +1,65 @@
+"""Nearest-sample search kernels checked against a brute-force scan."""
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from core import _fit_kernels
+
+
+def _brute_force_d2(xs, ys, qx, qy):
+    return ((xs[None, :] - qx[:, None]) ** 2 + (ys[None, :] - qy[:, None]) ** 2).min(axis=1)
+
+
+def _cases(trials: int = 500, seed: int = 0):
+    """Unevenly spaced samples, including a dense cluster beside a sparse run as near the LE."""
+    yield (
+        np.array([0.96, 0.97, 0.98, 0.99, 0.995, 0.996, 0.997, 0.998, 1.001, 1.2, 1.3, 1.4, 1.5]),
+        np.array([0.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 1.0, 0.1, 0.0, 0.0, 0.0, 0.0]),
+        np.array([1.0]),
+        np.array([0.0]),
+    )
+    rng = np.random.default_rng(seed)
+    for trial in range(trials):
+        dtype = np.float64 if trial % 2 else np.float32
+        xs = np.sort(np.concatenate((
+            rng.random(int(rng.integers(1, 60))) ** int(rng.integers(1, 5)),
+            1.0 - rng.random(int(rng.integers(0, 10))) * 1e-3,
+        ))).astype(dtype)
+        ys = (rng.standard_normal(len(xs)) * 10.0 ** rng.integers(-4, 0)).astype(dtype)
+        qx = (rng.random(20) * 1.2 - 0.1).astype(dtype)
+        qy = (rng.standard_normal(20) * 0.05).astype(dtype)
+        yield xs, ys, qx, qy
+
+
+class NearestSortedSamplesTest(unittest.TestCase):
+    def _check(self, search, ulps: int = 0) -> None:
+        for xs, ys, qx, qy in _cases():
+            min_d2 = np.empty(len(qx))
+            nn_idx = np.empty(len(qx), dtype=np.int64)
+            search(xs, ys, qx, qy, min_d2, nn_idx)
+            expected = _brute_force_d2(xs, ys, qx, qy)
+            rtol = ulps * np.finfo(xs.dtype).eps
+            np.testing.assert_allclose(min_d2, expected, rtol=rtol, atol=0, err_msg=f"xs={xs!r}")
+            np.testing.assert_allclose(
+                _brute_force_d2(xs[nn_idx], ys[nn_idx], qx, qy), expected, rtol=rtol, atol=0
+            )
+
+    def test_numpy_path(self) -> None:
+        def search(xs, ys, qx, qy, min_d2, nn_idx):
+            min_d2[:], nn_idx[:] = _fit_kernels._nearest_sorted_samples_numpy(xs, ys, qx, qy)
+
+        self._check(search)
+
+    def test_loop_as_python(self) -> None:
+        self._check(_fit_kernels._nearest_sorted_samples_loop)
+
+    @unittest.skipIf(_fit_kernels._nearest_sorted_samples_jit is None, "numba is not installed")
+    def test_compiled_loop(self) -> None:
+        # fastmath may contract the distance into fused multiply-adds
+        self._check(_fit_kernels._nearest_sorted_samples_jit, ulps=4)
+
+
+if __name__ == "__main__":
+    unittest.main()
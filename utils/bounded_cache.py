@@ -0,0 +1,40 @@
+"""Small bounded cache for values derived from short-lived objects."""
+
+from __future__ import annotations
+
+from typing import Any, Hashable
+
+
+class BoundedCache:
+    """
+    First-in-first-out cache holding at most ``max_size`` entries.
+
+    Entries keyed by ``id(obj)`` pass that object as ``owner``: the entry keeps it
+    alive, so the id cannot be reused while cached, and a lookup only hits for the
+    same object.
+    """
+
+    __slots__ = ("_entries", "_max_size")
+
+    def __init__(self, max_size: int) -> None:
+        self._entries: dict[Hashable, tuple[Any, Any]] = {}
+        self._max_size = max_size
+
+    def get(self, key: Hashable, owner: Any = None) -> Any:
+        """Return the value cached under ``key`` for ``owner``, or None."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] is not owner:
+            return None
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any, owner: Any = None) -> None:
+        """Store ``value`` under ``key``, evicting the oldest entry when full."""
+        if key not in self._entries and len(self._entries) >= self._max_size:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (owner, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
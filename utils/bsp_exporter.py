@@ -4,6 +4,18 @@ from __future__ import annotations
 
 from typing import Any
 
+import numpy as np
+
+_POINT_ROW = "%13.10f %13.10f\n"
+_KNOT_ROW = "%13.10f\n"
+
+
+def _format_section(values: Any, row_format: str) -> str:
+    """Format every row of ``values`` with ``row_format`` in a single ``%`` pass."""
+    flat = np.asarray(values, dtype=np.float64).ravel().tolist()
+    fields_per_row = row_format.count("%")
+    return (row_format * (len(flat) // fields_per_row)) % tuple(flat)
+
 
 def export_bspline_to_bsp(
     bspline_processor: Any,
@@ -26,28 +38,16 @@ def export_bspline_to_bsp(
         return False
 
     try:
-        with open(file_path, "w+", encoding="utf-8") as file:
-            file.write(f"{airfoil_name}\n")
-
-            file.write("Top Start\n")
-            for p in upper_cp:
-                file.write("%13.10f %13.10f\n" % (float(p[0]), float(p[1])))
-            file.write("Top End\n")
-
-            file.write("Top Knots Start\n")
-            for k in upper_knots:
-                file.write("%13.10f\n" % float(k))
-            file.write("Top Knots End\n")
-
-            file.write("Bottom Start\n")
-            for p in lower_cp:
-                file.write("%13.10f %13.10f\n" % (float(p[0]), float(p[1])))
-            file.write("Bottom End\n")
-
-            file.write("Bottom Knots Start\n")
-            for k in lower_knots:
-                file.write("%13.10f\n" % float(k))
-            file.write("Bottom Knots End\n")
+        # Build the whole file first so it reaches the OS in one write
+        payload = "".join((
+            f"{airfoil_name}\n",
+            "Top Start\n", _format_section(upper_cp, _POINT_ROW), "Top End\n",
+            "Top Knots Start\n", _format_section(upper_knots, _KNOT_ROW), "Top Knots End\n",
+            "Bottom Start\n", _format_section(lower_cp, _POINT_ROW), "Bottom End\n",
+            "Bottom Knots Start\n", _format_section(lower_knots, _KNOT_ROW), "Bottom Knots End\n",
+        ))
+        with open(file_path, "wb") as file:
+            file.write(payload.encode("utf-8"))
 
         return True
     except OSError as exc:
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BSPModelData:
     airfoil_name: str
     upper_control_points: np.ndarray
@@ -18,7 +19,23 @@ class BSPModelData:
 
 
 def _parse_float_list(lines: list[str], *, expected_cols: int, section_name: str) -> np.ndarray:
-    values: list[list[float]] = []
+    # Fast path: NumPy's C parser converts the whole section in one call. Anything it
+    # rejects (or an unexpected shape) goes through the per-line parser for a precise error.
+    values = None
+    if lines:
+        try:
+            values = np.loadtxt(lines, dtype=np.float64, comments=None, ndmin=2)
+        except ValueError:
+            pass
+    if values is not None and values.shape[0] > 0 and values.shape[1] == expected_cols:
+        return values
+    return _parse_float_list_by_line(lines, expected_cols=expected_cols, section_name=section_name)
+
+
+def _parse_float_list_by_line(lines: list[str], *, expected_cols: int, section_name: str) -> np.ndarray:
+    # Rows are written straight into a preallocated array sized by the non-blank line count
+    values = np.empty((sum(1 for line in lines if line.strip()), expected_cols), dtype=float)
+    row_idx = 0
     for idx, raw_line in enumerate(lines, start=1):
         line = raw_line.strip()
         if not line:
@@ -29,50 +46,74 @@ def _parse_float_list(lines: list[str], *, expected_cols: int, section_name: str
                 f"Section '{section_name}' line {idx} has {len(parts)} columns, expected {expected_cols}."
             )
         try:
-            row = [float(part) for part in parts]
+            values[row_idx] = [float(part) for part in parts]
         except ValueError as exc:
             raise ValueError(f"Invalid numeric value in section '{section_name}', line {idx}: {line}") from exc
-        values.append(row)
+        row_idx += 1
 
-    if not values:
+    if not row_idx:
         raise ValueError(f"Section '{section_name}' is empty.")
-    return np.asarray(values, dtype=float)
-
-
-def _slice_section(lines: list[str], start_label: str, end_label: str) -> list[str]:
-    try:
-        start_idx = lines.index(start_label)
-        end_idx = lines.index(end_label, start_idx + 1)
-    except ValueError as exc:
-        raise ValueError(f"Missing section markers '{start_label}'/'{end_label}'.") from exc
-    if end_idx <= start_idx + 1:
-        return []
+    return values
+
+
+_SECTION_MARKERS = (
+    ("Top Start", "Top End"),
+    ("Top Knots Start", "Top Knots End"),
+    ("Bottom Start", "Bottom End"),
+    ("Bottom Knots Start", "Bottom Knots End"),
+)
+_MARKER_SET = frozenset(label for pair in _SECTION_MARKERS for label in pair)
+
+
+def _index_markers(lines: list[str]) -> dict[str, list[int]]:
+    """Line indices of every section marker, collected in one pass."""
+    markers: dict[str, list[int]] = {}
+    for idx, line in enumerate(lines):
+        if line in _MARKER_SET:
+            markers.setdefault(line, []).append(idx)
+    return markers
+
+
+def _slice_section(
+    lines: list[str], markers: dict[str, list[int]], start_label: str, end_label: str
+) -> list[str]:
+    start_positions = markers.get(start_label)
+    start_idx = start_positions[0] if start_positions else None
+    end_idx = None
+    if start_idx is not None:
+        end_idx = next((idx for idx in markers.get(end_label, ()) if idx > start_idx), None)
+    if end_idx is None:
+        raise ValueError(f"Missing section markers '{start_label}'/'{end_label}'.")
     return lines[start_idx + 1 : end_idx]
 
 
-def load_bspline_from_bsp(file_path: str | Path) -> BSPModelData:
-    """Parse an AirfoilEditor-compatible .bsp file."""
-    path = Path(file_path)
-    if not path.is_file():
-        raise FileNotFoundError(f"BSP file not found: {path}")
+_PARSED_FILE_CACHE_SIZE = 16
+
 
-    raw_lines = path.read_text(encoding="utf-8").splitlines()
-    lines = [line.strip() for line in raw_lines if line.strip()]
+@functools.lru_cache(maxsize=_PARSED_FILE_CACHE_SIZE)
+def _load_bspline_cached(path_str: str, mtime_ns: int, size: int) -> BSPModelData:
+    """Parse ``path_str``; the stat fields only key the cache so an edited file is re-read."""
+    # One strip per line (the old filter stripped twice); blank lines are dropped
+    lines = [line for line in map(str.strip, Path(path_str).read_text(encoding="utf-8").splitlines()) if line]
     if len(lines) < 9:
         raise ValueError("BSP file is too short or malformed.")
 
     airfoil_name = lines[0]
 
-    upper_cp_lines = _slice_section(lines, "Top Start", "Top End")
-    upper_knot_lines = _slice_section(lines, "Top Knots Start", "Top Knots End")
-    lower_cp_lines = _slice_section(lines, "Bottom Start", "Bottom End")
-    lower_knot_lines = _slice_section(lines, "Bottom Knots Start", "Bottom Knots End")
+    markers = _index_markers(lines)
+    upper_cp_lines, upper_knot_lines, lower_cp_lines, lower_knot_lines = (
+        _slice_section(lines, markers, start_label, end_label) for start_label, end_label in _SECTION_MARKERS
+    )
 
     upper_cp = _parse_float_list(upper_cp_lines, expected_cols=2, section_name="Top")
     lower_cp = _parse_float_list(lower_cp_lines, expected_cols=2, section_name="Bottom")
     upper_knots = _parse_float_list(upper_knot_lines, expected_cols=1, section_name="Top Knots").reshape(-1)
     lower_knots = _parse_float_list(lower_knot_lines, expected_cols=1, section_name="Bottom Knots").reshape(-1)
 
+    # Cached arrays are never handed out directly; freeze them so a stray write fails loudly
+    for values in (upper_cp, lower_cp, upper_knots, lower_knots):
+        values.flags.writeable = False
+
     return BSPModelData(
         airfoil_name=airfoil_name,
         upper_control_points=upper_cp,
@@ -80,3 +121,24 @@ def load_bspline_from_bsp(file_path: str | Path) -> BSPModelData:
         upper_knots=upper_knots,
         lower_knots=lower_knots,
     )
+
+
+def load_bspline_from_bsp(file_path: str | Path) -> BSPModelData:
+    """Parse an AirfoilEditor-compatible .bsp file.
+
+    Parsed files are memoised by path, modification time and size, so re-opening an
+    unchanged file skips parsing. Each call returns fresh, writable array copies.
+    """
+    path = Path(file_path)
+    if not path.is_file():
+        raise FileNotFoundError(f"BSP file not found: {path}")
+
+    stat = path.stat()
+    cached = _load_bspline_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    return BSPModelData(
+        airfoil_name=cached.airfoil_name,
+        upper_control_points=cached.upper_control_points.copy(),
+        lower_control_points=cached.lower_control_points.copy(),
+        upper_knots=cached.upper_knots.copy(),
+        lower_knots=cached.lower_knots.copy(),
+    )
@@ -419,13 +419,12 @@ def calculate_curvature_comb_data(upper_curve: interpolate.BSpline, lower_curve:
         scale_factor: Scale factor for comb visualization
         
     Returns:
-        List of curvature comb data for both curves
+        List with one (N, 2, 2) array of [base, tip] hair segments per curve
     """
     all_curves_combs = []
     curves = [upper_curve, lower_curve]
     
     for curve in curves:
-        curve_comb_hairs = []
         t_start = curve.t[curve.k]
         t_end = curve.t[-(curve.k + 1)]
         t_vals = np.linspace(t_start, t_end, num_points_per_segment)
@@ -454,10 +453,6 @@ def calculate_curvature_comb_data(upper_curve: interpolate.BSpline, lower_curve:
         comb_lengths = -curvatures * scale_factor
         end_points = curve_points + normals * comb_lengths[:, np.newaxis]
         
-        for j in range(num_points_per_segment):
-            hair_segment = np.array([curve_points[j], end_points[j]])
-            curve_comb_hairs.append(hair_segment)
-        
-        all_curves_combs.append(curve_comb_hairs)
+        all_curves_combs.append(np.stack((curve_points, end_points), axis=1))
     
     return all_curves_combs if all_curves_combs else None
@@ -385,17 +385,35 @@ def export_airfoil_to_selig_format(upper_surface, lower_surface, airfoil_name, f
         airfoil_name (str): Name of the airfoil.
         filename (str): Output file path.
     """
-    with open(filename, 'w') as f:
-        # Write airfoil name
-        f.write(f"{airfoil_name}\n")
-        
-        # Write coordinates in Selig format: upper TE -> LE -> lower TE
-        # Upper surface from TE to LE (reverse order)
-        for i in range(len(upper_surface) - 1, -1, -1):
-            x, y = upper_surface[i]
-            f.write(f"{x:.6f} {y:.6f}\n")
-        
-        # Lower surface from LE to TE (skip first point as it's the same as upper LE)
-        for i in range(1, len(lower_surface)):
-            x, y = lower_surface[i]
-            f.write(f"{x:.6f} {y:.6f}\n")
+    upper_surface = np.asarray(upper_surface)
+    lower_surface = np.asarray(lower_surface)
+    export_airfoil_to_selig_format_soa(
+        upper_surface[:, 0], upper_surface[:, 1],
+        lower_surface[:, 0], lower_surface[:, 1],
+        airfoil_name, filename,
+    )
+
+
+def export_airfoil_to_selig_format_soa(upper_x, upper_y, lower_x, lower_y, airfoil_name, filename):
+    """
+    Export airfoil data in Selig format from separate x/y coordinate arrays.
+
+    Same output as :func:`export_airfoil_to_selig_format`, for callers that already
+    hold column views of their point arrays.
+
+    Args:
+        upper_x, upper_y (np.ndarray): Upper surface coordinates, ordered LE to TE.
+        lower_x, lower_y (np.ndarray): Lower surface coordinates, ordered LE to TE.
+        airfoil_name (str): Name of the airfoil.
+        filename (str): Output file path.
+    """
+    # Selig order: upper surface TE -> LE (reversed), then lower surface LE -> TE
+    # (skipping its first point, which is the same as the upper LE)
+    x = np.concatenate((np.asarray(upper_x)[::-1], np.asarray(lower_x)[1:]))
+    y = np.concatenate((np.asarray(upper_y)[::-1], np.asarray(lower_y)[1:]))
+    interleaved = np.column_stack((x, y)).ravel().tolist()
+    # One formatting pass over all rows, then a single write
+    payload = f"{airfoil_name}\n" + ("%.6f %.6f\n" * len(x)) % tuple(interleaved)
+
+    with open(filename, 'w', buffering=64 * 1024) as f:
+        f.write(payload)
@@ -1,8 +1,8 @@
+import array
 import traceback
 
 import ezdxf
 import numpy as np
-from scipy import interpolate
 
 DXF_EXPORT_MODE_NURBS = "nurbs"
 DXF_EXPORT_MODE_BEZIER = "bezier"
@@ -17,6 +17,50 @@ def _get_degree_pair(bspline_processor):
     return int(degree), int(degree)
 
 
+def _as_double_array(values):
+    """Copy ``values`` into an ``array('d')`` buffer-to-buffer (ezdxf stores knots in that form)."""
+    return array.array("d", np.ascontiguousarray(values, dtype=np.float64).tobytes())
+
+
+def _insert_knots(knots, ctrl, degree, insert_values):
+    """
+    Boehm knot insertion of every value in ``insert_values`` into a B-spline.
+
+    The knot and control point buffers are allocated once at their final size and
+    updated in place; each insertion is a handful of slice operations.
+
+    Args:
+        knots (np.ndarray): Knot vector of length n + degree + 1.
+        ctrl (np.ndarray): Control points, shape (n, dim).
+        degree (int): Spline degree.
+        insert_values (np.ndarray): Knots to insert, repeated for multiplicity.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The refined knot vector and control points.
+    """
+    n_t = len(knots)
+    n_c = len(ctrl)
+    total = len(insert_values)
+    t = np.empty(n_t + total, dtype=float)
+    c = np.empty((n_c + total, ctrl.shape[1]), dtype=float)
+    t[:n_t] = knots
+    c[:n_c] = ctrl
+
+    for u in insert_values.tolist():
+        i = int(np.searchsorted(t[:n_t], u, side="right")) - 1
+        lo = i - degree + 1
+        alpha = (u - t[lo : i + 1]) / (t[lo + degree : i + degree + 1] - t[lo : i + 1])
+        blended = (1.0 - alpha)[:, None] * c[lo - 1 : i] + alpha[:, None] * c[lo : i + 1]
+        c[i + 1 : n_c + 1] = c[i:n_c]
+        c[lo : i + 1] = blended
+        t[i + 2 : n_t + 1] = t[i + 1 : n_t]
+        t[i + 1] = u
+        n_t += 1
+        n_c += 1
+
+    return t, c
+
+
 def _decompose_bspline_to_bezier_segments(control_points, knot_vector, degree):
     """
     Decompose one clamped B-spline into Bezier control polygons.
@@ -34,42 +78,38 @@ def _decompose_bspline_to_bezier_segments(control_points, knot_vector, degree):
     if knots.ndim != 1:
         raise ValueError("Knot vector must be a 1D array.")
 
-    spline = interpolate.BSpline(knots, ctrl, degree)
+    if len(knots) != len(ctrl) + degree + 1:
+        raise ValueError("Knots, coefficients and degree are inconsistent.")
 
     unique_knots, counts = np.unique(knots, return_counts=True)
     if unique_knots.size < 2:
         return []
 
+    # Raise every interior knot to multiplicity == degree in one batched insertion pass
     start = unique_knots[0]
     end = unique_knots[-1]
-    for knot, count in zip(unique_knots, counts):
-        if np.isclose(knot, start) or np.isclose(knot, end):
-            continue
-        missing_mult = degree - int(count)
-        if missing_mult > 0:
-            spline = spline.insert_knot(float(knot), m=missing_mult)
-
-    full_knots = np.asarray(spline.t, dtype=float)
-    full_ctrl = np.asarray(spline.c, dtype=float)
-    k = int(spline.k)
-
-    segments = []
-    n = len(full_ctrl) - 1
-    for i in range(k, n + 1):
-        if i + 1 >= len(full_knots):
-            break
-        if full_knots[i + 1] <= full_knots[i]:
-            continue
-        segment_ctrl = full_ctrl[i - k : i + 1]
-        if len(segment_ctrl) == k + 1:
-            segments.append(segment_ctrl.copy())
-    return segments
+    interior = ~(np.isclose(unique_knots, start) | np.isclose(unique_knots, end))
+    missing = np.maximum(degree - counts, 0) * interior
+    if missing.any():
+        full_knots, full_ctrl = _insert_knots(knots, ctrl, degree, np.repeat(unique_knots, missing))
+    else:
+        # Already piecewise Bezier: every span's control polygon can be sliced out directly
+        full_knots, full_ctrl = knots, ctrl
+    k = degree
+
+    # Span i (t[i] < t[i + 1]) is driven by control points i - k .. i; gather all such windows at once
+    span_starts = np.arange(k, len(full_ctrl))
+    span_starts = span_starts[full_knots[span_starts + 1] > full_knots[span_starts]]
+    return list(full_ctrl[(span_starts - k)[:, None] + np.arange(k + 1)])
 
 
 def _add_nurbs_surface(msp, points, degree, knots, layer, color, logger_func, name):
-    spline = msp.add_open_spline(control_points=points, degree=degree, knots=knots)
-    spline.dxf.layer = layer
-    spline.dxf.color = color
+    msp.add_open_spline(
+        control_points=points,
+        degree=degree,
+        knots=knots,
+        dxfattribs={"layer": layer, "color": color},
+    )
     logger_func(f"  {name}: degree {degree} B-spline with {len(points)} control points")
 
 
@@ -78,15 +118,18 @@ def _add_bezier_surface(msp, control_points, knot_vector, degree, layer, color,
     if not segments:
         raise ValueError(f"No Bezier segments generated for {name}.")
 
-    bezier_knots = [0.0] * (degree + 1) + [1.0] * (degree + 1)
-    for segment in segments:
-        spline = msp.add_open_spline(
-            control_points=[tuple(pt.tolist()) for pt in segment],
+    bezier_knots = (0.0,) * (degree + 1) + (1.0,) * (degree + 1)
+    # All segment polygons converted in one call: (n_segments, degree + 1, dim) nested lists.
+    # Layer and colour go in with the entity, so each segment is a single modelspace add.
+    dxfattribs = {"layer": layer, "color": color}
+    add_open_spline = msp.add_open_spline
+    for segment_points in np.stack(segments).tolist():
+        add_open_spline(
+            control_points=segment_points,
             degree=degree,
             knots=bezier_knots,
+            dxfattribs=dxfattribs,
         )
-        spline.dxf.layer = layer
-        spline.dxf.color = color
     logger_func(f"  {name}: exported {len(segments)} Bezier segment(s), degree {degree}")
 
 
@@ -144,18 +187,18 @@ def export_bspline_to_dxf(bspline_processor, chord_length_mm, logger_func, expor
         doc.header["$INSUNITS"] = 4  # millimeters
         msp = doc.modelspace()
         
-        # Convert control points to format expected by ezdxf
-        upper_points = [tuple(pt.tolist()) for pt in upper_ctrl_pts_scaled]
-        lower_points = [tuple(pt.tolist()) for pt in lower_ctrl_pts_scaled]
+        # Convert control points to format expected by ezdxf (one tolist() per array; rows are lists)
+        upper_points = upper_ctrl_pts_scaled.tolist()
+        lower_points = lower_ctrl_pts_scaled.tolist()
         
-        # Convert knot vectors to lists (ezdxf expects a list)
-        upper_knots_list = upper_knots.tolist()
-        lower_knots_list = lower_knots.tolist()
+        # Knot vectors as array("d"), the container ezdxf keeps them in
+        upper_knots_d = _as_double_array(upper_knots)
+        lower_knots_d = _as_double_array(lower_knots)
         
         degree_upper, degree_lower = _get_degree_pair(bspline_processor)
         logger_func(f"Creating curves: degrees U={degree_upper}, L={degree_lower}")
-        logger_func(f"  Upper knot vector: {len(upper_knots_list)} knots")
-        logger_func(f"  Lower knot vector: {len(lower_knots_list)} knots")
+        logger_func(f"  Upper knot vector: {len(upper_knots_d)} knots")
+        logger_func(f"  Lower knot vector: {len(lower_knots_d)} knots")
 
         if mode == DXF_EXPORT_MODE_BEZIER:
             _add_bezier_surface(
@@ -183,7 +226,7 @@ def export_bspline_to_dxf(bspline_processor, chord_length_mm, logger_func, expor
                 msp,
                 upper_points,
                 degree_upper,
-                upper_knots_list,
+                upper_knots_d,
                 "AIRFOIL_UPPER",
                 1,
                 logger_func,
@@ -193,7 +236,7 @@ def export_bspline_to_dxf(bspline_processor, chord_length_mm, logger_func, expor
                 msp,
                 lower_points,
                 degree_lower,
-                lower_knots_list,
+                lower_knots_d,
                 "AIRFOIL_LOWER",
                 5,
                 logger_func,
@@ -202,10 +245,12 @@ def export_bspline_to_dxf(bspline_processor, chord_length_mm, logger_func, expor
         
         # Add trailing edge connector if needed (for blunt trailing edge)
         if not bspline_processor.is_sharp_te:
-            if not np.allclose(upper_ctrl_pts_scaled[-1], lower_ctrl_pts_scaled[-1]):
+            upper_te, lower_te = upper_points[-1], lower_points[-1]
+            # Same test as np.allclose (rtol=1e-5, atol=1e-8), on the already converted floats
+            if any(abs(u - l) > 1e-8 + 1e-5 * abs(l) for u, l in zip(upper_te, lower_te)):
                 msp.add_line(
-                    tuple(upper_ctrl_pts_scaled[-1].tolist()), 
-                    tuple(lower_ctrl_pts_scaled[-1].tolist()),
+                    tuple(upper_te),
+                    tuple(lower_te),
                     dxfattribs={'layer': 'TRAILING_EDGE_CONNECTOR', 'color': 2}  # Yellow
                 )
                 logger_func("  Added trailing edge connector for blunt trailing edge")